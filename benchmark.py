@@ -0,0 +1,161 @@
+import os
+
+# The benchmark always runs headless, it has to work on a CI box without a display
+os.environ['SLIDERS_HEADLESS'] = '1'
+
+import gc
+import json
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from itertools import cycle
+from statistics import quantiles
+from time import perf_counter
+
+import pygame as pg
+from pygame.locals import MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP
+
+from classScreen import screen
+from classHorizontalSliderButton import HorizontalSliderButton
+from classVerticalSliderButton import VerticalSliderButton
+from classSliderGroup import SliderGroup
+from classCompositor import Compositor
+from classChangeNotifier import notifier
+from classInputStage import InputStage
+
+PHASES = ('events', 'flush', 'update', 'present')
+
+
+def buildSliders(count):
+    # Lay the sliders out on a grid filling the screen, alternating both orientations
+    columns = max(int((count * screen.get_width() / screen.get_height()) ** 0.5), 1)
+    rows = -(-count // columns)
+    cellWidth, cellHeight = screen.get_width() // columns, screen.get_height() // rows
+    sliders = []
+    for index in range(count):
+        x, y = index % columns * cellWidth, index // columns * cellHeight
+        if index % 2:
+            sliders.append(VerticalSliderButton(pos=(x + cellWidth // 2, y + 4), size=(max(cellWidth // 4, 10), max(cellHeight - 8, 20))))
+        else:
+            sliders.append(HorizontalSliderButton(pos=(x + 4, y + cellHeight // 2), size=(max(cellWidth - 8, 20), max(cellHeight // 4, 10))))
+    return sliders
+
+
+def generateEvents(sliders, steps=30):
+    # Endless drags: hover a slider, press it, move it along its scale and back, release it
+    for slider in cycle(sliders):
+        index = slider.axis.index
+        start = slider.scaleRect[index]
+        length = slider.scaleRect.size[index]
+        pos = list(slider.sliderRect.center)
+        yield pg.event.Event(MOUSEMOTION, pos=tuple(pos), rel=(0, 0), buttons=(0, 0, 0))
+        yield pg.event.Event(MOUSEBUTTONDOWN, pos=tuple(pos), button=1)
+        for step in (*range(steps + 1), *range(steps, -1, -1)):
+            pos[index] = start + length * step // steps
+            yield pg.event.Event(MOUSEMOTION, pos=tuple(pos), rel=(0, 0), buttons=(1, 0, 0))
+        yield pg.event.Event(MOUSEBUTTONUP, pos=tuple(pos), button=1)
+
+
+def runFrames(group, compositor, inputStage, events, frames, eventsPerFrame, timings=None, allocations=None):
+    for _ in range(frames):
+        if allocations is not None:
+            tracemalloc.reset_peak()
+            startMemory = tracemalloc.get_traced_memory()[0]
+            startBlocks = sys.getallocatedblocks()
+
+        phaseStart = perf_counter()
+        for event in inputStage.coalesce([next(events) for _ in range(eventsPerFrame)]):
+            group.handleEvent(event)
+        flushStart = perf_counter()
+        notifier.flush()
+        updateStart = perf_counter()
+        rects = compositor.compose()
+        presentStart = perf_counter()
+        compositor.present(rects)
+        phaseEnd = perf_counter()
+
+        if timings is not None:
+            timings['events'].append(flushStart - phaseStart)
+            timings['flush'].append(updateStart - flushStart)
+            timings['update'].append(presentStart - updateStart)
+            timings['present'].append(phaseEnd - presentStart)
+            timings['frame'].append(phaseEnd - phaseStart)
+        if allocations is not None:
+            allocations['bytes'].append(tracemalloc.get_traced_memory()[1] - startMemory)
+            allocations['blocks'].append(sys.getallocatedblocks() - startBlocks)
+
+
+def getPercentiles(samples):
+    cuts = quantiles(samples, n=100, method='inclusive')
+    return {'p50': cuts[49] * 1000, 'p95': cuts[94] * 1000, 'p99': cuts[98] * 1000, 'max': max(samples) * 1000}
+
+
+def runBenchmark(count, frames, eventsPerFrame, warmup, coalesce=True):
+    sliders = buildSliders(count)
+    group = SliderGroup(sliders=sliders)
+    compositor = Compositor(screen=screen, background='steelblue', widgets=group.sliders)
+    inputStage = InputStage(coalesceMotion=coalesce)
+    events = generateEvents(sliders)
+
+    runFrames(group, compositor, inputStage, events, warmup, eventsPerFrame)
+
+    # Timed pass
+    timings = {phase: [] for phase in (*PHASES, 'frame')}
+    gcBefore = gc.get_stats()[0]['collections']
+    runFrames(group, compositor, inputStage, events, frames, eventsPerFrame, timings=timings)
+    gcCollections = gc.get_stats()[0]['collections'] - gcBefore
+
+    # Allocations are traced in a separate pass, tracing slows everything down
+    allocations = {'bytes': [], 'blocks': []}
+    tracemalloc.start()
+    runFrames(group, compositor, inputStage, events, frames, eventsPerFrame, allocations=allocations)
+    tracemalloc.stop()
+
+    totalTime = sum(timings['frame'])
+    return {
+        'sliders': count,
+        'frames': frames,
+        'eventsPerFrame': eventsPerFrame,
+        'eventsPerSecond': frames * eventsPerFrame / sum(timings['events']),
+        'framesPerSecond': frames / totalTime,
+        'phases': {phase: getPercentiles(timings[phase]) for phase in (*PHASES, 'frame')},
+        'allocatedBytesPerFrame': sum(allocations['bytes']) / frames,
+        'netBlocksPerFrame': sum(allocations['blocks']) / frames,
+        'gcCollectionsPerFrame': gcCollections / frames,
+    }
+
+
+def printReport(result):
+    print(f"{result['sliders']} sliders, {result['frames']} frames, {result['eventsPerFrame']} events per frame")
+    print(f"events/sec {result['eventsPerSecond']:.0f} | frames/sec {result['framesPerSecond']:.1f}")
+    print(f"{'phase':<10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for phase, stats in result['phases'].items():
+        print(f"{phase:<10}{stats['p50']:>10.3f}{stats['p95']:>10.3f}{stats['p99']:>10.3f}{stats['max']:>10.3f}")
+    print(f"allocations per frame: {result['allocatedBytesPerFrame']:.0f} bytes peak, "
+          f"{result['netBlocksPerFrame']:.1f} net blocks, {result['gcCollectionsPerFrame']:.3f} gen0 collections")
+
+
+def main():
+    parser = ArgumentParser(description='Headless benchmark of the slider event, update and present paths.')
+    parser.add_argument('--sliders', type=int, default=200, help='number of sliders, half of them vertical')
+    parser.add_argument('--frames', type=int, default=500, help='number of measured frames')
+    parser.add_argument('--events-per-frame', type=int, default=20, help='number of synthesized events per frame')
+    parser.add_argument('--warmup', type=int, default=50, help='number of frames run before measuring')
+    parser.add_argument('--no-coalesce', action='store_true', help='pass every motion event to the sliders')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args()
+
+    pg.init()
+    # Logging every change would measure the log sink, not the sliders
+    notifier.logLevel = None
+
+    result = runBenchmark(args.sliders, args.frames, args.events_per_frame, args.warmup, not args.no_coalesce)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        printReport(result)
+    pg.quit()
+
+
+if __name__ == '__main__':
+    main()
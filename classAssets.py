@@ -0,0 +1,125 @@
+import pygame as pg
+from pygame import Surface, Rect
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class AssetManager:
+    """
+    A process-wide cache of decoded images and of the sprites cut out of them.
+
+    Every image is decoded once and converted to the display format. Sprites are cut out
+    of an image, optionally made transparent where the background of the sheet shows,
+    scaled to the size they are drawn at, optionally made translucent and converted once,
+    then shared through an LRU cache keyed by image, area, size, background color and alpha. Nothing is decoded or scaled
+    while drawing. Images loaded before the display exists are converted as soon as it
+    does, like the surfaces of `SliderStyle`.
+
+    Attributes:
+        root (Path): The directory the images are loaded from.
+        maxScaled (int): The maximum number of sprites kept in the cache.
+        threshold (int): How far from the background color a pixel may be and still be transparent.
+        images (dict): The decoded images keyed by name.
+        scaled (OrderedDict): The sprites in least recently used order.
+
+    Methods:
+        convert(surface, hasAlpha): Converts a surface to the display format if the display exists.
+        load(name): Returns the decoded image of the given name.
+        getGridRects(name, columns, rows): Returns the areas of the cells of a regular sheet.
+        cutOut(surface, background): Makes the background around a sprite transparent.
+        getSprite(name, area, size, background, alpha): Returns a shared sprite cut out of an image.
+        getSprites(name, frames, size, background, alpha): Returns the sprites of a sheet keyed by state.
+        clear(): Drops all the cached images and sprites.
+    """
+
+    root: Path = Path(__file__).parent / 'images'
+    maxScaled: int = 64
+    threshold: int = 10
+    images: dict = field(default_factory=dict)
+    scaled: OrderedDict = field(default_factory=OrderedDict)
+
+    def __post_init__(self):
+        # The keys of the images and sprites created before the display existed
+        self.unconverted = set()
+
+    def convert(self, surface, hasAlpha):
+        # Surfaces can only be converted once the display exists
+        if pg.display.get_surface() is None:
+            return surface, False
+        return (surface.convert_alpha() if hasAlpha else surface.convert()), True
+
+    def load(self, name):
+        image = self.images.get(name)
+        if image is None or (name in self.unconverted and pg.display.get_surface() is not None):
+            # Decoding a large image is slow, it is done once per process
+            image, isConverted = self.convert(pg.image.load(self.root / name), False)
+            self.images[name] = image
+            if isConverted:
+                self.unconverted.discard(name)
+            else:
+                self.unconverted.add(name)
+        return image
+
+    def getGridRects(self, name, columns, rows):
+        width, height = self.load(name).get_size()
+        cellWidth, cellHeight = width // columns, height // rows
+        return {(column, row): Rect(column * cellWidth, row * cellHeight, cellWidth, cellHeight)
+                for row in range(rows) for column in range(columns)}
+
+    def cutOut(self, surface, background):
+        # The background is the area of the background color connected to the top left corner
+        tolerance = (self.threshold, self.threshold, self.threshold, 255)
+        outside = pg.mask.from_threshold(surface, background, tolerance).connected_component((0, 0))
+        outside.invert()
+        stencil = outside.to_surface(setcolor=(255, 255, 255, 255), unsetcolor=(255, 255, 255, 0))
+
+        sprite = Surface(surface.get_size(), pg.SRCALPHA)
+        sprite.blit(surface, (0, 0))
+        sprite.blit(stencil, (0, 0), special_flags=pg.BLEND_RGBA_MULT)
+        return sprite
+
+    def getSprite(self, name, area=None, size=None, background=None, alpha=None):
+        area = tuple(area) if area is not None else None
+        size = tuple(size) if size is not None else None
+        key = (name, area, size, background, alpha)
+        sprite = self.scaled.get(key)
+        if sprite is not None and not (key in self.unconverted and pg.display.get_surface() is not None):
+            self.scaled.move_to_end(key)
+            return sprite
+
+        image = self.load(name)
+        sprite = image.subsurface(area) if area is not None else image
+        if background is not None:
+            sprite = self.cutOut(sprite, background)
+        if size is not None and size != sprite.get_size():
+            sprite = pg.transform.smoothscale(sprite, size)
+        sprite, isConverted = self.convert(sprite, background is not None)
+        if alpha is not None:
+            # The translucent sprite is a copy, the opaque one may be the shared image itself
+            sprite = sprite.copy()
+            sprite.set_alpha(alpha)
+        if isConverted:
+            self.unconverted.discard(key)
+        else:
+            self.unconverted.add(key)
+
+        self.scaled[key] = sprite
+        # Evict the least recently used sprite when the cache is full
+        if len(self.scaled) > self.maxScaled:
+            evicted, _ = self.scaled.popitem(last=False)
+            self.unconverted.discard(evicted)
+        return sprite
+
+    def getSprites(self, name, frames, size=None, background=None, alpha=None):
+        return {state: self.getSprite(name, area, size, background, alpha) for state, area in frames.items()}
+
+    def clear(self):
+        self.images.clear()
+        self.scaled.clear()
+        self.unconverted.clear()
+
+
+assets = AssetManager()
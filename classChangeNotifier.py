@@ -0,0 +1,184 @@
+from dataclasses import dataclass, field
+from queue import SimpleQueue
+from threading import Thread
+from time import perf_counter
+
+
+@dataclass(eq=False)
+class Subscription:
+    """
+    A class representing a callback subscribed to the value changes of a slider.
+
+    Attributes:
+        slider (object): The slider whose changes are delivered.
+        callback (object): The function called with the slider and its new value.
+        throttle (float): The minimum time in seconds between two deliveries.
+        debounce (float): The time in seconds the value has to stay unchanged before it is delivered.
+        background (bool): Whether the callback is called on the background thread instead of the UI loop.
+        value (int | float): The latest value not delivered yet.
+        isPending (bool): Whether there is a value waiting for delivery.
+        lastChanged (float): The time of the latest change.
+        lastDelivered (float): The time of the latest delivery.
+        isCancelled (bool): Whether the subscription has been removed.
+        notifier (ChangeNotifier): The notifier delivering the values, the global one if None.
+
+    Methods:
+        getDueTime(): Returns the time when the pending value can be delivered.
+        cancel(): Stops the deliveries.
+    """
+
+    slider: object = None
+    callback: object = None
+    throttle: float = 0
+    debounce: float = 0
+    background: bool = False
+    value: int | float = None
+    isPending: bool = False
+    lastChanged: float = 0
+    lastDelivered: float = float('-inf')
+    isCancelled: bool = False
+    notifier: object = field(default=None, repr=False)
+
+    def getDueTime(self):
+        return max(self.lastChanged + self.debounce, self.lastDelivered + self.throttle)
+
+    def cancel(self):
+        (self.notifier or notifier).unsubscribe(self)
+
+
+@dataclass
+class ChangeNotifier:
+    """
+    A class collecting value changes of sliders and delivering them once per frame.
+
+    Sliders only mark themselves as changed, which is cheap enough to do on every mouse
+    event. Once per frame `flush()` logs each changed slider once and passes its latest
+    value to the subscriptions, so a subscriber gets at most one notification per frame
+    per slider no matter how many motion events there were. Throttled and debounced
+    subscriptions keep their latest value until it is due. Background subscriptions are
+    called on a worker thread so a slow callback never blocks the UI loop. Flush hooks get
+    all the sliders changed in a frame at once, after their values were logged.
+
+    Attributes:
+        logLevel (str | None): The loguru level the changes are logged at, None to disable logging.
+        subscriptions (dict): The subscriptions keyed by the id of their slider.
+        changed (dict): The sliders changed since the last flush, keyed by their id.
+        waiting (list): The subscriptions holding a value that is not due yet.
+        flushHooks (list): The functions called with the list of sliders changed in a frame.
+
+    Methods:
+        subscribe(slider, callback, throttle, debounce, background): Subscribes a callback to a slider.
+        unsubscribe(subscription): Removes a subscription.
+        addFlushHook(hook): Adds a function called with the sliders changed in a frame.
+        removeFlushHook(hook): Removes a flush hook.
+        markChanged(slider): Marks a slider as changed.
+        getNextDue(now): Returns the time in seconds until the next waiting value is due.
+        flush(now): Logs the changed sliders and delivers the values that are due.
+        deliver(subscription): Calls the callback of a subscription with its value.
+        startWorker(): Starts the background thread running the background callbacks.
+        runWorker(): Runs the background callbacks from the queue.
+    """
+
+    logLevel: str | None = 'DEBUG'
+    subscriptions: dict = field(default_factory=dict)
+    changed: dict = field(default_factory=dict)
+    waiting: list = field(default_factory=list)
+    flushHooks: list = field(default_factory=list)
+
+    def __post_init__(self):
+        self.queue = None
+        self.worker = None
+
+    def subscribe(self, slider, callback, throttle=0, debounce=0, background=False):
+        subscription = Subscription(slider, callback, throttle, debounce, background, notifier=self)
+        self.subscriptions.setdefault(id(slider), []).append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        subscription.isCancelled = True
+        subscription.isPending = False
+        subscriptions = self.subscriptions.get(id(subscription.slider), [])
+        if subscription in subscriptions:
+            subscriptions.remove(subscription)
+            if not subscriptions:
+                del self.subscriptions[id(subscription.slider)]
+        if subscription in self.waiting:
+            self.waiting.remove(subscription)
+
+    def addFlushHook(self, hook):
+        self.flushHooks.append(hook)
+
+    def removeFlushHook(self, hook):
+        if hook in self.flushHooks:
+            self.flushHooks.remove(hook)
+
+    def markChanged(self, slider):
+        self.changed[id(slider)] = slider
+
+    def getNextDue(self, now=None):
+        if not self.waiting:
+            return None
+        now = perf_counter() if now is None else now
+        return max(min(subscription.getDueTime() for subscription in self.waiting) - now, 0)
+
+    def flush(self, now=None):
+        now = perf_counter() if now is None else now
+
+        if self.changed:
+            changed, self.changed = self.changed, {}
+            # loguru is only imported once there is something to log
+            if self.logLevel is not None:
+                from loguru import logger
+            for key, slider in changed.items():
+                if self.logLevel is not None:
+                    logger.log(self.logLevel, f'{type(slider).__name__} at {slider.pos}: {slider.currentValue}')
+                # Only the latest value of the frame is kept
+                for subscription in self.subscriptions.get(key, ()):
+                    subscription.value = slider.currentValue
+                    subscription.lastChanged = now
+                    if not subscription.isPending:
+                        subscription.isPending = True
+                        self.waiting.append(subscription)
+            if self.flushHooks:
+                sliders = list(changed.values())
+                for hook in self.flushHooks:
+                    hook(sliders)
+
+        if self.waiting:
+            waiting = []
+            # A callback may cancel subscriptions, so the loop runs over a snapshot of the list
+            for subscription in list(self.waiting):
+                if subscription.isCancelled:
+                    continue
+                if subscription.getDueTime() <= now:
+                    subscription.isPending = False
+                    subscription.lastDelivered = now
+                    self.deliver(subscription)
+                else:
+                    waiting.append(subscription)
+            self.waiting = waiting
+
+    def deliver(self, subscription):
+        if subscription.background:
+            if self.worker is None:
+                self.startWorker()
+            self.queue.put((subscription.callback, subscription.slider, subscription.value))
+        else:
+            subscription.callback(subscription.slider, subscription.value)
+
+    def startWorker(self):
+        self.queue = SimpleQueue()
+        self.worker = Thread(target=self.runWorker, name='ChangeNotifier', daemon=True)
+        self.worker.start()
+
+    def runWorker(self):
+        while True:
+            callback, slider, value = self.queue.get()
+            try:
+                callback(slider, value)
+            except Exception:
+                from loguru import logger
+                logger.exception('Background change callback failed')
+
+
+notifier = ChangeNotifier()
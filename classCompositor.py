@@ -0,0 +1,103 @@
+import pygame as pg
+from pygame import Surface
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Compositor:
+    """
+    A class that redraws only the parts of the screen that have changed.
+
+    Instead of filling the whole screen and redrawing every widget on every frame, the
+    compositor asks each widget which rectangles it has invalidated since the last frame,
+    restores only those rectangles from a cached background, redraws the widgets that
+    intersect them and presents just those rectangles with `pg.display.update(rects)`.
+
+    Widgets have to provide `getDirtyRects()`, `getBounds()` and `update(target)`.
+
+    Attributes:
+        screen (object): The surface the widgets are drawn on.
+        background (str | tuple | Surface): The background color or image of the screen.
+        widgets (list): The widgets drawn by the compositor.
+
+    Methods:
+        __post_init__(): Creates the cached background.
+        createBackground(): Creates the cached background surface.
+        invalidate(): Forces a full redraw on the next frame.
+        collectDirtyRects(): Collects and merges the rectangles invalidated by the widgets.
+        compose(): Redraws the invalidated rectangles and returns them.
+        present(rects): Shows the given rectangles on the display.
+        render(): Composes and presents one frame.
+    """
+
+    screen: object = None
+    background: str | tuple | Surface = 'steelblue'
+    widgets: list = field(default_factory=list)
+
+    def __post_init__(self):
+        self.createBackground()
+
+    def createBackground(self):
+        # Use a copy of the given image or fill a surface of the screen size with the given color
+        if isinstance(self.background, Surface):
+            self.backgroundSurface = self.background.copy()
+        else:
+            self.backgroundSurface = Surface(self.screen.get_size())
+            self.backgroundSurface.fill(self.background)
+        self.fullRedraw = True
+
+    def invalidate(self):
+        self.fullRedraw = True
+
+    def collectDirtyRects(self):
+        rects = []
+        for widget in self.widgets:
+            rects.extend(widget.getDirtyRects())
+
+        # Merge overlapping rectangles so no area is restored and presented twice
+        merged = []
+        for rect in rects:
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def compose(self):
+        screenRect = self.screen.get_rect()
+
+        # Redraw everything on the first frame or after the screen has been invalidated
+        if self.fullRedraw:
+            self.fullRedraw = False
+            self.screen.blit(self.backgroundSurface, (0, 0))
+            for widget in self.widgets:
+                widget.update(self.screen)
+            return [screenRect]
+
+        # Rectangles outside the screen are empty after clipping and are skipped
+        rects = [rect for rect in (rect.clip(screenRect) for rect in self.collectDirtyRects()) if rect]
+        if not rects:
+            return rects
+
+        bounds = [(widget, widget.getBounds()) for widget in self.widgets]
+        for rect in rects:
+            # Restore the background and redraw the intersecting widgets only inside the rectangle
+            self.screen.set_clip(rect)
+            self.screen.blit(self.backgroundSurface, rect, rect)
+            for widget, widgetRect in bounds:
+                if widgetRect.colliderect(rect):
+                    widget.update(self.screen)
+        self.screen.set_clip(None)
+        return rects
+
+    def present(self, rects):
+        # An offscreen target has nothing to present
+        if rects and self.screen is pg.display.get_surface():
+            pg.display.update(rects)
+
+    def render(self):
+        rects = self.compose()
+        self.present(rects)
+        return rects
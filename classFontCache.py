@@ -0,0 +1,63 @@
+import pygame as pg
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+
+@dataclass
+class FontCache:
+    """
+    A process-wide registry of loaded fonts and rendered text surfaces.
+
+    Looking up and loading a system font is slow, so every font is loaded once per
+    (name, size) pair and shared by all widgets. Short static labels (such as the min
+    and max values of a slider) are also rendered once and shared through a small
+    LRU cache keyed by text, color, font name and size.
+
+    Attributes:
+        maxRendered (int): The maximum number of rendered text surfaces kept in the cache.
+        fonts (dict): The loaded fonts keyed by (name, size).
+        rendered (OrderedDict): The rendered text surfaces in least recently used order.
+
+    Methods:
+        getFont(name, size): Returns the shared font for the given name and size.
+        getKey(text, color, name, size): Returns the key of a rendered text in the cache.
+        render(text, color, name, size): Returns a shared rendered surface for a static text.
+        clear(): Drops all cached fonts and rendered surfaces.
+    """
+
+    maxRendered: int = 512
+    fonts: dict = field(default_factory=dict)
+    rendered: OrderedDict = field(default_factory=OrderedDict)
+
+    def getFont(self, name='arial', size=14):
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            # Fonts can only be loaded once the font module is initialized
+            if not pg.font.get_init():
+                pg.font.init()
+            font = self.fonts[key] = pg.font.SysFont(name, size)
+        return font
+
+    def getKey(self, text, color, name='arial', size=14):
+        return (text, str(color), name, size)
+
+    def render(self, text, color, name='arial', size=14):
+        key = self.getKey(text, color, name, size)
+        surface = self.rendered.get(key)
+        if surface is None:
+            surface = self.rendered[key] = self.getFont(name, size).render(text, True, color)
+            # Evict the least recently used surface when the cache is full
+            if len(self.rendered) > self.maxRendered:
+                self.rendered.popitem(last=False)
+        else:
+            self.rendered.move_to_end(key)
+        return surface
+
+    def clear(self):
+        self.fonts.clear()
+        self.rendered.clear()
+
+
+fontCache = FontCache()
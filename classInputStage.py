@@ -0,0 +1,89 @@
+import pygame as pg
+from pygame.locals import QUIT, MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP, WINDOWEXPOSED, VIDEOEXPOSE
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class InputStage:
+    """
+    A class filtering and coalescing the events before they reach the widgets.
+
+    Only the allowed event types ever enter the pygame queue, everything else is blocked
+    at the source. Runs of consecutive motion events are merged into a single event with
+    the latest position and buttons and the summed relative motion, so a slider dragged
+    with a high polling rate mouse is recomputed once per frame instead of once per event.
+    Button presses and releases split the runs, so no transition is lost.
+
+    Attributes:
+        allowed (list): The event types delivered to the widgets.
+        coalesceMotion (bool): Whether consecutive motion events are merged.
+
+    Methods:
+        allow(*types): Adds event types to the allowed ones.
+        install(): Blocks all the event types that are not allowed.
+        filter(events): Drops the events that are not allowed.
+        coalesce(events): Merges the runs of consecutive motion events.
+        poll(): Returns the pending allowed events, coalesced.
+        wait(timeout): Waits for an allowed event and returns it with the pending ones, coalesced.
+    """
+
+    allowed: list = field(default_factory=lambda: [QUIT, MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP, WINDOWEXPOSED, VIDEOEXPOSE])
+    coalesceMotion: bool = True
+
+    def __post_init__(self):
+        self.allowedTypes = set(self.allowed)
+
+    def allow(self, *types):
+        for eventType in types:
+            if eventType not in self.allowed:
+                self.allowed.append(eventType)
+        self.allowedTypes = set(self.allowed)
+        if pg.display.get_init():
+            pg.event.set_allowed(list(types))
+
+    def install(self):
+        # Blocking a type drops its queued events, keep the allowed ones and post them again
+        pending = self.filter(pg.event.get())
+        pg.event.set_blocked(None)
+        pg.event.set_allowed(self.allowed)
+        for event in pending:
+            pg.event.post(event)
+
+    def coalesce(self, events):
+        if not self.coalesceMotion or len(events) < 2:
+            return events
+
+        coalesced = []
+        run = []
+        for event in events + [None]:
+            if event is not None and event.type == MOUSEMOTION:
+                run.append(event)
+                continue
+            if run:
+                if len(run) == 1:
+                    coalesced.append(run[0])
+                else:
+                    # Keep the latest position and buttons and the whole relative motion of the run
+                    last = run[-1]
+                    rel = (sum(motion.rel[0] for motion in run), sum(motion.rel[1] for motion in run))
+                    coalesced.append(pg.event.Event(MOUSEMOTION, {**last.dict, 'rel': rel}))
+                run = []
+            if event is not None:
+                coalesced.append(event)
+        return coalesced
+
+    def filter(self, events):
+        # Events queued before the filter was installed may still be of any type
+        allowedTypes = self.allowedTypes
+        return [event for event in events if event.type in allowedTypes]
+
+    def poll(self):
+        # A typed get returns the events grouped by type, so all of them are taken in order
+        return self.coalesce(self.filter(pg.event.get()))
+
+    def wait(self, timeout):
+        event = pg.event.wait(timeout)
+        if event.type == pg.NOEVENT:
+            return []
+        return self.coalesce(self.filter([event] + pg.event.get()))
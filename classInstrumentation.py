@@ -0,0 +1,252 @@
+from classSlider import Slider
+from classSliderStyle import SliderStyle
+from classFontCache import FontCache
+from classLoopDriver import LoopDriver
+
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter_ns
+
+# The counters kept for every slider and for all of them together
+COUNTERS = ('events', 'changes', 'surfaces', 'textRenders', 'blits')
+
+
+@dataclass
+class Histogram:
+    """
+    A class counting durations in power of two buckets.
+
+    Bucket `i` holds the durations below `2 ** i` microseconds (counted as 1024 ns), so
+    adding a duration is a shift and a bit length and the percentiles are read from the
+    bucket bounds.
+
+    Attributes:
+        buckets (list): The number of durations in every bucket.
+        count (int): The number of durations.
+        total (int): The sum of the durations in nanoseconds.
+        maximum (int): The longest duration in nanoseconds.
+
+    Methods:
+        add(duration): Adds a duration in nanoseconds.
+        getPercentile(fraction): Returns the upper bound in microseconds of the given fraction of the durations.
+        getSummary(): Returns the count, total, mean, percentiles and maximum.
+    """
+
+    buckets: list = field(default_factory=lambda: [0] * 32)
+    count: int = 0
+    total: int = 0
+    maximum: int = 0
+
+    def add(self, duration):
+        self.buckets[min((duration >> 10).bit_length(), 31)] += 1
+        self.count += 1
+        self.total += duration
+        if duration > self.maximum:
+            self.maximum = duration
+
+    def getPercentile(self, fraction):
+        threshold = fraction * self.count
+        running = 0
+        for index, count in enumerate(self.buckets):
+            running += count
+            if running >= threshold:
+                # The bound of the bucket, but never more than the longest duration
+                return min((1 << index) * 1.024, self.maximum / 1000)
+        return self.maximum / 1000
+
+    def getSummary(self):
+        return {
+            'count': self.count,
+            'totalMs': self.total / 1e6,
+            'meanUs': self.total / self.count / 1000 if self.count else 0.0,
+            'p50Us': self.getPercentile(0.5),
+            'p95Us': self.getPercentile(0.95),
+            'p99Us': self.getPercentile(0.99),
+            'maxUs': self.maximum / 1000,
+        }
+
+
+@dataclass
+class Instrumentation:
+    """
+    A class counting and timing what the sliders do, switched on only when needed.
+
+    Enabling the instrumentation replaces the measured methods of `Slider`, `SliderStyle`,
+    `FontCache` and `LoopDriver` with timing wrappers, and disabling it puts the original
+    methods back, so while it is disabled not a single check is left on the hot paths.
+    Every slider gets its own counters next to the aggregate ones, and every phase gets
+    a histogram of its durations. The phases are inclusive, `handleEvent` contains the
+    `changeCurrentValue` it triggers and `draw` contains `drawText`. The time of a slider
+    is the time of its event handling and drawing.
+
+    Attributes:
+        enabled (bool): Whether the measured methods are wrapped.
+        totals (dict): The aggregate counters.
+        sliders (dict): The counters and time of every slider, keyed by its id.
+        phases (dict): The histograms keyed by phase name.
+
+    Methods:
+        enable(): Wraps the measured methods.
+        disable(): Restores the original methods.
+        setEnabled(enabled): Enables or disables the instrumentation.
+        reset(): Clears all the counters and histograms.
+        getCounters(slider): Returns the counters of a slider.
+        getHistogram(phase): Returns the histogram of a phase.
+        patch(cls, name, wrapper): Replaces a method with a wrapper of it.
+        wrapSliderMethod(method, phase, counter, blits, isTopLevel): Returns a wrapper timing and counting a slider method.
+        wrapRenderValueText(method): Returns a wrapper counting the value labels actually rendered.
+        wrapCreateSurface(method): Returns a wrapper counting the style surfaces allocated.
+        wrapRender(method): Returns a wrapper counting the static labels rendered on a cache miss.
+        wrapRenderFrame(method): Returns a wrapper recording the phases of a frame.
+        stats(top): Returns a snapshot of the counters and timings.
+    """
+
+    enabled: bool = False
+    totals: dict = field(default_factory=lambda: dict.fromkeys(COUNTERS, 0))
+    sliders: dict = field(default_factory=dict)
+    phases: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.originals = []
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.patch(Slider, 'handleEvent', lambda method: self.wrapSliderMethod(method, 'handleEvent', 'events', isTopLevel=True))
+        self.patch(Slider, 'changeCurrentValue', lambda method: self.wrapSliderMethod(method, 'changeCurrentValue', 'changes'))
+        self.patch(Slider, 'updateFillSurface', lambda method: self.wrapSliderMethod(method, 'updateFillSurface'))
+        self.patch(Slider, 'renderValueText', self.wrapRenderValueText)
+        self.patch(Slider, 'drawText', lambda method: self.wrapSliderMethod(method, 'drawText', blits=lambda slider: 3))
+        # The button layer is only blitted when it is not fully transparent
+        self.patch(Slider, 'draw', lambda method: self.wrapSliderMethod(method, 'draw', blits=lambda slider: 4 if slider.style.buttonAlpha else 3, isTopLevel=True))
+        self.patch(SliderStyle, 'createSurface', self.wrapCreateSurface)
+        self.patch(FontCache, 'render', self.wrapRender)
+        self.patch(LoopDriver, 'renderFrame', self.wrapRenderFrame)
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        for cls, name, method in reversed(self.originals):
+            setattr(cls, name, method)
+        self.originals = []
+
+    def setEnabled(self, enabled):
+        if enabled:
+            self.enable()
+        else:
+            self.disable()
+
+    def reset(self):
+        self.totals = dict.fromkeys(COUNTERS, 0)
+        self.sliders = {}
+        self.phases = {}
+
+    def getCounters(self, slider):
+        counters = self.sliders.get(id(slider))
+        if counters is None:
+            counters = self.sliders[id(slider)] = {'slider': slider, 'time': 0, **dict.fromkeys(COUNTERS, 0)}
+        return counters
+
+    def getHistogram(self, phase):
+        histogram = self.phases.get(phase)
+        if histogram is None:
+            histogram = self.phases[phase] = Histogram()
+        return histogram
+
+    def patch(self, cls, name, wrapper):
+        method = getattr(cls, name)
+        self.originals.append((cls, name, method))
+        setattr(cls, name, wrapper(method))
+
+    def wrapSliderMethod(self, method, phase, counter=None, blits=None, isTopLevel=False):
+        @wraps(method)
+        def wrapper(slider, *args, **kwargs):
+            start = perf_counter_ns()
+            result = method(slider, *args, **kwargs)
+            duration = perf_counter_ns() - start
+
+            self.getHistogram(phase).add(duration)
+            counters = self.getCounters(slider)
+            if isTopLevel:
+                counters['time'] += duration
+            if counter is not None:
+                counters[counter] += 1
+                self.totals[counter] += 1
+            if blits is not None:
+                count = blits(slider)
+                counters['blits'] += count
+                self.totals['blits'] += count
+            return result
+        return wrapper
+
+    def wrapRenderValueText(self, method):
+        @wraps(method)
+        def wrapper(slider):
+            valueText = slider.valueText
+            start = perf_counter_ns()
+            method(slider)
+            self.getHistogram('renderValueText').add(perf_counter_ns() - start)
+
+            # The label is only rendered, and a surface allocated, when the displayed value changed
+            if slider.valueText is not valueText:
+                counters = self.getCounters(slider)
+                for counter in ('textRenders', 'surfaces'):
+                    counters[counter] += 1
+                    self.totals[counter] += 1
+        return wrapper
+
+    def wrapCreateSurface(self, method):
+        @wraps(method)
+        def wrapper(style, layer, state):
+            start = perf_counter_ns()
+            surface = method(style, layer, state)
+            self.getHistogram('createSurface').add(perf_counter_ns() - start)
+            # Style surfaces are shared, they are only counted in the totals
+            if surface is not None:
+                self.totals['surfaces'] += 1
+            return surface
+        return wrapper
+
+    def wrapRender(self, method):
+        @wraps(method)
+        def wrapper(cache, text, color, name='arial', size=14):
+            isCached = cache.getKey(text, color, name, size) in cache.rendered
+            start = perf_counter_ns()
+            surface = method(cache, text, color, name, size)
+            self.getHistogram('renderLabel').add(perf_counter_ns() - start)
+            if not isCached:
+                self.totals['textRenders'] += 1
+                self.totals['surfaces'] += 1
+            return surface
+        return wrapper
+
+    def wrapRenderFrame(self, method):
+        @wraps(method)
+        def wrapper(driver, events):
+            timings = method(driver, events)
+            eventsStart, updateStart, presentStart, presentEnd = timings
+            self.getHistogram('frame.events').add(int((updateStart - eventsStart) * 1e9))
+            self.getHistogram('frame.update').add(int((presentStart - updateStart) * 1e9))
+            self.getHistogram('frame.present').add(int((presentEnd - presentStart) * 1e9))
+            return timings
+        return wrapper
+
+    def stats(self, top=None):
+        # The sliders that took the most time first
+        sliders = sorted(self.sliders.values(), key=lambda counters: counters['time'], reverse=True)
+        if top is not None:
+            sliders = sliders[:top]
+        return {
+            'enabled': self.enabled,
+            'totals': dict(self.totals),
+            'phases': {phase: histogram.getSummary() for phase, histogram in self.phases.items()},
+            'sliders': [{'name': f"{type(counters['slider']).__name__} at {counters['slider'].pos}",
+                         'timeMs': counters['time'] / 1e6,
+                         **{counter: counters[counter] for counter in COUNTERS}}
+                        for counters in sliders],
+        }
+
+
+instrumentation = Instrumentation()
@@ -0,0 +1,208 @@
+import pygame as pg
+
+from classChangeNotifier import notifier
+from classInputStage import InputStage
+
+from dataclasses import dataclass, field
+from time import perf_counter
+
+
+# A custom event used to wake up a loop that is waiting for input
+WAKEUP = pg.event.custom_type()
+
+
+@dataclass
+class LoopStats:
+    """
+    A class holding the timings of the main loop.
+
+    All timings are in milliseconds and smoothed with an exponential moving average,
+    so a single slow frame does not make the numbers jump.
+
+    Attributes:
+        smoothing (float): The weight of the latest frame in the moving average.
+        frames (int): The number of frames run so far.
+        frameTime (float): The time of a whole frame, including pacing.
+        fps (float): The frames per second derived from the frame time.
+        eventsTime (float): The time spent polling and handling events.
+        updateTime (float): The time spent redrawing the widgets.
+        presentTime (float): The time spent presenting the frame on the display.
+        idleTime (float): The time spent waiting for input or sleeping to keep the FPS cap.
+
+    Methods:
+        record(frameTime, eventsTime, updateTime, presentTime, idleTime): Adds a frame to the stats.
+    """
+
+    smoothing: float = 0.1
+    frames: int = 0
+    frameTime: float = 0.0
+    fps: float = 0.0
+    eventsTime: float = 0.0
+    updateTime: float = 0.0
+    presentTime: float = 0.0
+    idleTime: float = 0.0
+
+    def record(self, frameTime, eventsTime, updateTime, presentTime, idleTime):
+        # The first frame has nothing to average with
+        weight = 1.0 if self.frames == 0 else self.smoothing
+        self.frames += 1
+        self.frameTime += (frameTime - self.frameTime) * weight
+        self.eventsTime += (eventsTime - self.eventsTime) * weight
+        self.updateTime += (updateTime - self.updateTime) * weight
+        self.presentTime += (presentTime - self.presentTime) * weight
+        self.idleTime += (idleTime - self.idleTime) * weight
+        self.fps = 1000 / self.frameTime if self.frameTime else 0.0
+
+
+@dataclass
+class LoopDriver:
+    """
+    A class driving the main loop with frame pacing and an on-demand redraw mode.
+
+    In the default mode the loop runs continuously and is capped at `fps` frames per
+    second, sleeping between frames instead of spinning. In the on-demand mode the loop
+    blocks in `pg.event.wait()` while nothing is invalidated and only wakes up for input,
+    for a programmatic change (see `wakeUp()`) or after `waitTimeout` milliseconds.
+
+    `runAsync()` runs the same frames as an asyncio task. Instead of sleeping in the clock
+    or blocking in `pg.event.wait()` it awaits the rest of every frame, so value streams
+    and other async I/O run between the frames without ever delaying them.
+
+    Attributes:
+        compositor (object): The compositor that redraws and presents the widgets.
+        handlers (list): The objects whose `handleEvent(event)` receives the events.
+        fps (int): The maximum number of frames per second, 0 for no cap.
+        onDemand (bool): Whether to wait for input while nothing has to be redrawn.
+        waitTimeout (int): The maximum time in milliseconds to wait for input.
+        statsInterval (float): The interval in seconds between logged stats, 0 to disable logging.
+        inputStage (InputStage): The stage filtering and coalescing the events.
+        stats (LoopStats): The timings of the loop.
+        running (bool): Whether the loop is running.
+
+    Methods:
+        __post_init__(): Creates the clock used for frame pacing.
+        wakeUp(): Wakes up a loop waiting for input, safe to call from other threads.
+        hasPendingWork(): Checks whether anything has to be redrawn.
+        pollEvents(): Returns the pending events, waiting for them in the on-demand mode.
+        handleEvent(event): Handles the loop events and passes the others to the handlers.
+        runFrame(): Runs a single frame.
+        renderFrame(events): Handles the events, delivers the changes and redraws, returns the phase start times.
+        recordFrame(frameStart, eventsStart, updateStart, presentStart, presentEnd): Records the timings of a frame.
+        logStats(): Logs the current stats.
+        start(): Installs the event filter and marks the loop as running.
+        run(): Runs the loop until the window is closed or `stop()` is called.
+        runAsync(): Runs the loop as an asyncio task, yielding to the asyncio loop every frame.
+        stop(): Stops the loop after the current frame.
+    """
+
+    compositor: object = None
+    handlers: list = field(default_factory=list)
+    fps: int = 60
+    onDemand: bool = False
+    waitTimeout: int = 500
+    statsInterval: float = 0
+    stats: LoopStats = field(default_factory=LoopStats)
+    inputStage: InputStage = field(default_factory=InputStage)
+    running: bool = False
+
+    def __post_init__(self):
+        self.clock = pg.time.Clock()
+        self.lastStatsLog = perf_counter()
+        # The loop has to be woken up even though the widgets never see this event
+        self.inputStage.allow(WAKEUP)
+
+    def wakeUp(self):
+        pg.event.post(pg.event.Event(WAKEUP))
+
+    def hasPendingWork(self):
+        if self.compositor.fullRedraw:
+            return True
+        return any(widget.isDirty for widget in self.compositor.widgets)
+
+    def pollEvents(self):
+        # Block until there is input, a wake up or the timeout
+        if self.onDemand and not self.hasPendingWork():
+            # Wake up in time for throttled or debounced values waiting for delivery
+            timeout = self.waitTimeout
+            nextDue = notifier.getNextDue()
+            if nextDue is not None:
+                timeout = min(timeout, int(nextDue * 1000) + 1)
+            return self.inputStage.wait(timeout)
+        return self.inputStage.poll()
+
+    def handleEvent(self, event):
+        if event.type == pg.QUIT:
+            self.running = False
+        # The window contents may have been lost, redraw everything
+        elif event.type in (pg.WINDOWEXPOSED, pg.VIDEOEXPOSE):
+            self.compositor.invalidate()
+        elif event.type != WAKEUP:
+            for handler in self.handlers:
+                handler.handleEvent(event)
+
+    def runFrame(self):
+        frameStart = perf_counter()
+        timings = self.renderFrame(self.pollEvents())
+        # Sleep the rest of the frame to keep the FPS cap
+        self.clock.tick(self.fps)
+        self.recordFrame(frameStart, *timings)
+
+    def renderFrame(self, events):
+        # Time spent blocked in the on-demand wait is idle time, not event handling
+        eventsStart = perf_counter()
+        for event in events:
+            self.handleEvent(event)
+        # Deliver the value changes of this frame
+        notifier.flush()
+
+        updateStart = perf_counter()
+        rects = self.compositor.compose()
+
+        presentStart = perf_counter()
+        self.compositor.present(rects)
+        return eventsStart, updateStart, presentStart, perf_counter()
+
+    def recordFrame(self, frameStart, eventsStart, updateStart, presentStart, presentEnd):
+        frameEnd = perf_counter()
+        self.stats.record((frameEnd - frameStart) * 1000,
+                          (updateStart - eventsStart) * 1000,
+                          (presentStart - updateStart) * 1000,
+                          (presentEnd - presentStart) * 1000,
+                          ((eventsStart - frameStart) + (frameEnd - presentEnd)) * 1000)
+
+        if self.statsInterval and frameEnd - self.lastStatsLog >= self.statsInterval:
+            self.lastStatsLog = frameEnd
+            self.logStats()
+
+    def logStats(self):
+        # loguru is only imported once the stats are logged
+        from loguru import logger
+        stats = self.stats
+        logger.debug(f'fps {stats.fps:.1f} | frame {stats.frameTime:.2f} ms | events {stats.eventsTime:.2f} ms | '
+                     f'update {stats.updateTime:.2f} ms | present {stats.presentTime:.2f} ms | idle {stats.idleTime:.2f} ms')
+
+    def start(self):
+        # Event types nobody handles never enter the queue
+        self.inputStage.install()
+        self.running = True
+
+    def run(self):
+        self.start()
+        while self.running:
+            self.runFrame()
+
+    async def runAsync(self):
+        import asyncio
+        self.start()
+        while self.running:
+            frameStart = perf_counter()
+            # Waiting for input would block the asyncio loop, the events are polled every frame
+            timings = self.renderFrame(self.inputStage.poll())
+            # The rest of the frame goes to the other tasks instead of sleeping in the clock
+            delay = 1 / self.fps - (perf_counter() - frameStart) if self.fps else 0
+            await asyncio.sleep(max(delay, 0))
+            self.recordFrame(frameStart, *timings)
+
+    def stop(self):
+        self.running = False
+        self.wakeUp()
@@ -0,0 +1,134 @@
+import pygame as pg
+from pygame import Surface, Rect
+from pygame.locals import KEYDOWN, K_F3
+
+from classScreen import getScreen
+from classFontCache import fontCache
+from classInstrumentation import instrumentation
+
+from dataclasses import dataclass
+from time import perf_counter
+
+
+@dataclass
+class PerfOverlay:
+    """
+    A widget drawing the FPS and the sliders taking the most time on top of the screen.
+
+    The overlay is hidden until its key is pressed. Showing it enables the instrumentation
+    and hiding it disables the instrumentation again, unless it was already enabled
+    before. The text is rendered again every `refreshInterval` seconds only, so the
+    overlay does not add a redraw to every frame.
+
+    Attributes:
+        stats (LoopStats): The timings of the loop the FPS is read from.
+        pos (tuple): The position of the overlay on the screen.
+        toggleKey (int): The key showing and hiding the overlay.
+        top (int): The number of sliders listed.
+        refreshInterval (float): The time in seconds between two refreshes of the text.
+        textColor (str | tuple): The color of the text.
+        backgroundColor (tuple): The color of the translucent panel behind the text.
+        fontName (str): The name of the font.
+        fontSize (int): The size of the font.
+        isVisible (bool): Whether the overlay is shown.
+        isDirty (bool): Whether the overlay has to be redrawn.
+
+    Methods:
+        handleEvent(event): Toggles the overlay when its key is pressed.
+        toggle(): Shows or hides the overlay.
+        getLines(): Returns the lines of text of the overlay.
+        refresh(): Renders the panel with the current numbers.
+        getBounds(): Returns the area covered by the overlay.
+        getDirtyRects(): Returns the areas invalidated since the last frame.
+        update(target): Draws the overlay on the target or the window.
+    """
+
+    stats: object = None
+    pos: tuple = (8, 8)
+    toggleKey: int = K_F3
+    top: int = 5
+    refreshInterval: float = 0.5
+    textColor: str | tuple = 'white'
+    backgroundColor: tuple = (0, 0, 0, 160)
+    fontName: str = 'consolas'
+    fontSize: int = 14
+    isVisible: bool = False
+    isDirty: bool = False
+
+    def __post_init__(self):
+        self.panel = None
+        self.rect = Rect(self.pos, (0, 0))
+        self.drawnRect = None
+        self.lastRefresh = float('-inf')
+        self.enabledInstrumentation = False
+
+    def handleEvent(self, event):
+        if event.type == KEYDOWN and event.key == self.toggleKey:
+            self.toggle()
+
+    def toggle(self):
+        self.isVisible = not self.isVisible
+        if self.isVisible:
+            # Only switch the instrumentation off again if the overlay switched it on
+            self.enabledInstrumentation = not instrumentation.enabled
+            instrumentation.enable()
+            self.lastRefresh = float('-inf')
+        elif self.enabledInstrumentation:
+            instrumentation.disable()
+        self.isDirty = True
+
+    def getLines(self):
+        lines = []
+        if self.stats is not None:
+            lines.append(f'fps {self.stats.fps:.1f} | frame {self.stats.frameTime:.2f} ms')
+        totals = instrumentation.totals
+        lines.append(f"events {totals['events']} | changes {totals['changes']} | blits {totals['blits']} | "
+                     f"texts {totals['textRenders']} | surfaces {totals['surfaces']}")
+        for slider in instrumentation.stats(self.top)['sliders']:
+            lines.append(f"{slider['name']}: {slider['timeMs']:.2f} ms, {slider['events']} events, {slider['blits']} blits")
+        return lines
+
+    def refresh(self):
+        font = fontCache.getFont(self.fontName, self.fontSize)
+        texts = [font.render(line, True, self.textColor) for line in self.getLines()]
+        width = max(text.get_width() for text in texts) + 8
+        height = sum(text.get_height() for text in texts) + 8
+
+        self.panel = Surface((width, height), pg.SRCALPHA)
+        self.panel.fill(self.backgroundColor)
+        y = 4
+        for text in texts:
+            self.panel.blit(text, (4, y))
+            y += text.get_height()
+        self.rect = self.panel.get_rect(topleft=self.pos)
+        self.isDirty = True
+
+    def getBounds(self):
+        # A hidden overlay still covers the area it has to erase
+        if self.isVisible:
+            return self.rect
+        return self.drawnRect or Rect(self.pos, (0, 0))
+
+    def getDirtyRects(self):
+        if self.isVisible:
+            now = perf_counter()
+            if now - self.lastRefresh >= self.refreshInterval:
+                self.lastRefresh = now
+                self.refresh()
+        if not self.isDirty:
+            return []
+        rects = [self.rect.copy()] if self.isVisible else []
+        if self.drawnRect is not None:
+            rects.append(self.drawnRect)
+        return rects
+
+    def update(self, target=None):
+        target = target if target is not None else getScreen()
+        if self.isVisible:
+            if self.panel is None:
+                self.refresh()
+            target.blit(self.panel, self.rect)
+            self.drawnRect = self.rect.copy()
+        else:
+            self.drawnRect = None
+        self.isDirty = False
@@ -1,3 +1,34 @@
+import os
+
 import pygame as pg
 
-screen = pg.display.set_mode((800,600))
\ No newline at end of file
+SIZE = (800, 600)
+
+# Set SLIDERS_HEADLESS=1 to run without a window, for example on a CI box without a display
+headless = os.environ.get('SLIDERS_HEADLESS', '0') != '0'
+if headless:
+    # The dummy driver needs no display, it has to be chosen before the display is initialized
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+# The window is only created when it is first needed
+window = None
+
+
+def getScreen():
+    global window
+    if window is None:
+        if headless:
+            # The display may have been initialized with another driver before this module was imported
+            if pg.display.get_init() and pg.display.get_driver() != os.environ['SDL_VIDEODRIVER']:
+                pg.display.quit()
+            pg.display.init()
+        # The dummy driver has a real display surface, presenting it is measured like with a window
+        window = pg.display.set_mode(SIZE)
+    return window
+
+
+def __getattr__(name):
+    # Keep `from classScreen import screen` working, it now creates the window on first use
+    if name == 'screen':
+        return getScreen()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,167 @@
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from classChangeNotifier import notifier
+
+from dataclasses import dataclass, field
+
+# The layout of the block, all float64: [sequence, count, size of the names, values...],
+# followed by the names of the values as UTF-8 separated by newlines
+SEQUENCE, COUNT, NAMES_SIZE = 0, 1, 2
+HEADER_SIZE = 3
+
+
+@dataclass
+class SharedValuesPublisher:
+    """
+    A class mirroring the values of sliders into a shared memory block.
+
+    The block has a fixed layout of float64 numbers, a header followed by one value per
+    slider in the order of `sliders`, so other processes can map it and read the values
+    without any serialization. The values changed in a frame are written together once
+    per frame from a notifier flush hook. The sequence number in the header is a seqlock:
+    it is odd while a frame is being written and grows by two with every frame, so
+    readers can detect and retry a torn read without ever taking a lock.
+
+    Attributes:
+        sliders (list): The sliders whose values are published.
+        names (list): The names readers look the values up by, the slider indexes if None.
+        name (str): The name of the shared memory block.
+
+    Methods:
+        __post_init__(): Creates the block, writes the header and the current values.
+        publish(sliders): Writes the values of the given sliders.
+        close(): Stops publishing and removes the block.
+    """
+
+    sliders: list = field(default_factory=list)
+    names: list = None
+    name: str = 'sliders'
+
+    def __post_init__(self):
+        if self.names is None:
+            self.names = [str(index) for index in range(len(self.sliders))]
+        self.indexes = {id(slider): HEADER_SIZE + index for index, slider in enumerate(self.sliders)}
+
+        namesData = '\n'.join(self.names).encode()
+        valuesSize = (HEADER_SIZE + len(self.sliders)) * 8
+        self.block = SharedMemory(self.name, create=True, size=valuesSize + len(namesData))
+        self.block.buf[valuesSize:valuesSize + len(namesData)] = namesData
+        self.array = self.block.buf[:valuesSize].cast('d')
+        self.array[COUNT] = len(self.sliders)
+        self.array[NAMES_SIZE] = len(namesData)
+
+        self.publish(self.sliders)
+        notifier.addFlushHook(self.publish)
+
+    def publish(self, sliders):
+        array = self.array
+        # An odd sequence tells the readers a write is in progress
+        array[SEQUENCE] += 1
+        for slider in sliders:
+            index = self.indexes.get(id(slider))
+            if index is not None:
+                array[index] = slider.currentValue
+        array[SEQUENCE] += 1
+
+    def close(self):
+        notifier.removeFlushHook(self.publish)
+        self.array.release()
+        self.block.close()
+        self.block.unlink()
+
+
+@dataclass
+class SharedValuesReader:
+    """
+    A class reading the slider values published in a shared memory block.
+
+    The values are read through a NumPy view of the block, so polling them costs no
+    more than reading an array. Reads follow the seqlock of the publisher: they are
+    retried while a frame is being written, so a read never mixes two frames.
+
+    Attributes:
+        name (str): The name of the shared memory block.
+
+    Methods:
+        __post_init__(): Attaches the block and reads the names of the values.
+        attachUntracked(): Attaches the block without registering it with the resource tracker.
+        getArray(): Returns the NumPy view of the whole block.
+        getSequence(): Returns the sequence number of the latest frame.
+        read(out): Returns a consistent copy of all the values.
+        get(key): Returns a single value by name or index.
+        close(): Detaches the block.
+    """
+
+    name: str = 'sliders'
+
+    def __post_init__(self):
+        try:
+            self.block = SharedMemory(self.name, track=False)
+        except TypeError:
+            self.block = self.attachUntracked()
+
+        header = self.block.buf[:HEADER_SIZE * 8].cast('d')
+        self.count, namesSize = int(header[COUNT]), int(header[NAMES_SIZE])
+        header.release()
+        valuesSize = (HEADER_SIZE + self.count) * 8
+        namesData = bytes(self.block.buf[valuesSize:valuesSize + namesSize]).decode()
+        self.names = namesData.split('\n') if namesData else []
+        self.indexes = {name: index for index, name in enumerate(self.names)}
+        self.array = None
+
+    def attachUntracked(self):
+        # Before Python 3.13 attaching registers the block with the resource tracker, which would
+        # remove it when this process exits. Unregistering afterwards is no better: workers started
+        # by multiprocessing share the tracker of the publisher and would drop its registration
+        register = resource_tracker.register
+
+        def registerOthers(name, rtype):
+            if rtype != 'shared_memory' or name.lstrip('/') != self.name.lstrip('/'):
+                register(name, rtype)
+
+        resource_tracker.register = registerOthers
+        try:
+            return SharedMemory(self.name)
+        finally:
+            resource_tracker.register = register
+
+    def getArray(self):
+        # NumPy is only imported by the readers, the publisher does not need it
+        if self.array is None:
+            import numpy as np
+            self.array = np.ndarray((HEADER_SIZE + self.count,), dtype=np.float64, buffer=self.block.buf)
+        return self.array
+
+    def getSequence(self):
+        return int(self.getArray()[SEQUENCE])
+
+    def read(self, out=None):
+        array = self.getArray()
+        values = array[HEADER_SIZE:]
+        while True:
+            sequence = array[SEQUENCE]
+            if not sequence % 2:
+                if out is None:
+                    snapshot = values.copy()
+                else:
+                    # Polling into the same array allocates nothing
+                    out[:] = values
+                    snapshot = out
+                if array[SEQUENCE] == sequence:
+                    return snapshot
+
+    def get(self, key):
+        array = self.getArray()
+        index = HEADER_SIZE + (key if isinstance(key, int) else self.indexes[key])
+        while True:
+            sequence = array[SEQUENCE]
+            if not sequence % 2:
+                value = array[index]
+                if array[SEQUENCE] == sequence:
+                    return float(value)
+
+    def close(self):
+        # The view has to be gone before the block can be closed
+        self.array = None
+        self.block.close()
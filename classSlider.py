@@ -0,0 +1,454 @@
+from pygame.locals import MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP
+from pygame import Surface, Rect
+
+from classScreen import getScreen
+from classFontCache import fontCache
+from classSliderStyle import SliderStyle
+from classChangeNotifier import notifier
+from classValueStream import ValueStream
+
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+
+
+@dataclass(frozen=True, slots=True)
+class Orientation:
+    """
+    A class describing the axis a slider moves along.
+
+    Attributes:
+        name (str): The name of the orientation.
+        index (int): The index of the axis in positions and sizes, 0 for x and 1 for y.
+        direction (int): 1 if the value grows with the coordinate, -1 if it grows towards smaller coordinates.
+    """
+
+    name: str
+    index: int
+    direction: int
+
+
+ORIENTATIONS = {
+    'horizontal': Orientation('horizontal', 0, 1),
+    'vertical': Orientation('vertical', 1, -1),
+}
+
+# The fields a slider shares with its style
+STYLE_FIELDS = ('size', 'colorButton', 'colorScaleLeft', 'hoverColorSlider', 'colorSlider',
+                'hoverColor', 'textColor', 'disabledColor')
+
+# Pixel to value lookup tables shared by all sliders with the same scale length and range,
+# in least recently used order. Sliders keep their own table, the cache only holds the recent ones
+MAX_PIXEL_VALUE_TABLES = 64
+pixelValueTables = OrderedDict()
+
+
+def getPixelValues(length, minValue, maxValue):
+    key = (length, minValue, maxValue)
+    table = pixelValueTables.get(key)
+    if table is None:
+        oneStepValue = length / (maxValue - minValue)
+        table = pixelValueTables[key] = tuple(minValue + pixel / oneStepValue for pixel in range(length + 1))
+        # Evict the least recently used table when the cache is full
+        if len(pixelValueTables) > MAX_PIXEL_VALUE_TABLES:
+            pixelValueTables.popitem(last=False)
+    else:
+        pixelValueTables.move_to_end(key)
+    return table
+
+
+@dataclass(slots=True)
+class Slider:
+    """
+    A class representing a slider with a scale and a draggable slider along one axis.
+
+    This is the engine shared by `HorizontalSliderButton` and `VerticalSliderButton`.
+    Everything that depends on the direction of the slider is driven by its `orientation`,
+    and the value for every pixel of the scale is looked up in a table shared by all
+    sliders with the same scale length and range. All the state is kept in slots.
+
+    Attributes:
+        screen (object): The surface the slider is drawn on, the window if None.
+        pos (tuple): The position of the slider on the screen.
+        size (tuple): The size of the slider.
+        minValue (int | float): The minimum value of the slider.
+        maxValue (int | float): The maximum value of the slider.
+        currentValue (int | float): The current value of the slider.
+        colorButton (str | tuple): The color of the button.
+        colorScaleLeft (str | tuple): The color of the filled part of the scale.
+        hoverColorSlider (str | tuple): The color of the slider when hovered.
+        colorSlider (str | tuple): The color of the slider.
+        hoverColor (str | tuple): The color when the slider is hovered.
+        textColor (str | tuple): The color of the text.
+        disabledColor (str | tuple): The color when the slider is disabled.
+        isHovered (bool): Whether the slider is currently hovered.
+        isClicked (bool): Whether the slider is currently clicked.
+        onEnabled (bool): Whether the slider is enabled.
+        orientation (str): The orientation of the slider, 'horizontal' or 'vertical'.
+        style (SliderStyle): The shared look of the slider, created from the fields above if None.
+
+    Methods:
+        __post_init__(): Initializes the slider surfaces and rectangles.
+        getScaleStart(): Returns the coordinate of the end of the scale where the minimum value is.
+        valueToPixel(value): Returns the coordinate of the slider center for the given value.
+        pixelToValue(pixel): Returns the value for the given coordinate of the slider center.
+        createFillSurface(): Creates the rectangles of the filled part of the scale.
+        updateFillSurface(): Resizes the filled part of the scale without allocating surfaces.
+        changeCurrentValue(): Updates the current value of the slider based on its position.
+        onChange(callback, throttle, debounce, background): Subscribes a callback to the value changes.
+        values(throttle, debounce): Returns an async iterator over the latest values.
+        checkPosition(event): Checks and updates the position of the slider based on mouse events.
+        handleEvent(event): Handles mouse events to move the slider and change its state.
+        setSliderState(state): Switches the slider between its normal, hover and disabled looks.
+        setEnabled(enabled): Enables or disables the slider.
+        setValue(value, notify): Moves the slider to a value within its range, telling the subscribers if notify is set.
+        setRange(minValue, maxValue, notify): Changes the range of the slider, keeping its value within it.
+        moveTo(pos): Moves the whole slider to a new position.
+        invalidate(): Marks the whole area drawn so far and the whole slider for a redraw.
+        createLabels(): Renders the static min and max labels once.
+        renderValueText(): Renders the value label when the displayed value changes.
+        getLabelRects(): Returns the rectangles of the min, max and value labels.
+        getBounds(): Returns the whole area covered by the slider.
+        getDirtyRects(): Returns the areas invalidated since the last frame.
+        getTarget(surface): Returns the surface to draw on.
+        drawText(surface, offset): Draws the text (min, max, and current values) on the surface.
+        draw(surface, offset): Draws the slider on the surface, shifted by the offset.
+        update(target): Draws the slider on the target, its screen or the window.
+    """
+
+    screen: object = None
+    pos: tuple = (0, 0)
+    size: tuple = (200, 50)
+    minValue: int | float = 0
+    maxValue: int | float = 100
+    currentValue: int | float = 50
+    colorButton: str | tuple = 'LightGray'
+    colorScaleLeft: str | tuple = 'green'
+    hoverColorSlider: str | tuple = 'red'
+    colorSlider: str | tuple = 'Maroon'
+    hoverColor: str | tuple = 'darkgray'
+    textColor: str | tuple = 'white'
+    disabledColor: str | tuple = 'darkgray'
+
+    isHovered: bool = False
+    isClicked: bool = False
+    onEnabled: bool = True
+
+    orientation: str = 'horizontal'
+    style: SliderStyle = field(default=None, repr=False)
+
+    axis: Orientation = field(init=False, repr=False, default=None)
+    buttonRect: Rect = field(init=False, repr=False, default=None)
+    scaleRect: Rect = field(init=False, repr=False, default=None)
+    sliderRect: Rect = field(init=False, repr=False, default=None)
+    sliderState: str = field(init=False, repr=False, default=None)
+    oneStepValue: float = field(init=False, repr=False, default=None)
+    pixelValues: tuple = field(init=False, repr=False, default=None)
+    fillState: str = field(init=False, repr=False, default=None)
+    fillRect: Rect = field(init=False, repr=False, default=None)
+    fillArea: Rect = field(init=False, repr=False, default=None)
+    minText: Surface = field(init=False, repr=False, default=None)
+    maxText: Surface = field(init=False, repr=False, default=None)
+    valueLabel: str = field(init=False, repr=False, default=None)
+    valueText: Surface = field(init=False, repr=False, default=None)
+    isDirty: bool = field(init=False, repr=False, default=True)
+    drawnRects: tuple = field(init=False, repr=False, default=None)
+    staleRects: tuple = field(init=False, repr=False, default=())
+
+    def __post_init__(self):
+        self.axis = axis = ORIENTATIONS[self.orientation]
+        index = axis.index
+
+        # Sliders that look the same share one style and its surfaces
+        if self.style is None:
+            self.style = SliderStyle(**{name: getattr(self, name) for name in STYLE_FIELDS}, orientation=self.orientation)
+        else:
+            if self.style.orientation != self.orientation:
+                self.style = replace(self.style, orientation=self.orientation)
+            # The style decides the look, keep the fields in line with it
+            for name in STYLE_FIELDS:
+                setattr(self, name, getattr(self.style, name))
+        length = self.size[index]
+
+        # Get the rectangle of the button, the button itself is transparent and never drawn
+        self.buttonRect = Rect(self.pos, self.size)
+
+        # Get the rectangle of the scale, centered on the button
+        self.scaleRect = Rect((0, 0), self.style.getScaleSize())
+        self.scaleRect.center = self.buttonRect.center
+
+        # Take the slider state, a disabled slider may never get an event
+        self.setSliderState('normal' if self.onEnabled else 'disabled')
+
+        # Calculate the value of one step on the scale and get the shared pixel to value table
+        self.oneStepValue = length / (self.maxValue - self.minValue)
+        self.pixelValues = getPixelValues(length, self.minValue, self.maxValue)
+
+        # Get the rectangle of the slider surface and set its center to the current value
+        center = list(self.scaleRect.center)
+        center[index] = self.valueToPixel(self.currentValue)
+        self.sliderRect = Rect((0, 0), self.style.getSliderSize())
+        self.sliderRect.center = center
+
+        # Render the static labels
+        self.createLabels()
+
+        # Create the filled part of the scale
+        self.createFillSurface()
+        self.changeCurrentValue()
+
+    def getScaleStart(self):
+        # The minimum is on the left of a horizontal scale and at the bottom of a vertical one
+        if self.axis.direction > 0:
+            return self.scaleRect[self.axis.index]
+        return self.scaleRect[self.axis.index] + self.scaleRect.size[self.axis.index]
+
+    def valueToPixel(self, value):
+        # The minimum value sits at the start of the scale
+        return self.getScaleStart() + self.axis.direction * (value - self.minValue) * self.oneStepValue
+
+    def pixelToValue(self, pixel):
+        offset = (pixel - self.getScaleStart()) * self.axis.direction
+        # Positions outside the scale are only reachable with an initial value out of range
+        if 0 <= offset < len(self.pixelValues):
+            return self.pixelValues[offset]
+        return self.minValue + offset / self.oneStepValue
+
+    @property
+    def buttonSurface(self):
+        return self.style.getSurface('button')
+
+    @property
+    def scaleSurface(self):
+        return self.style.getSurface('scale')
+
+    @property
+    def sliderSurface(self):
+        return self.style.getSurface('slider', self.sliderState)
+
+    @property
+    def fillSurface(self):
+        return self.style.getSurface('fill', self.fillState)
+
+    def createFillSurface(self):
+        # The filled part is drawn from the full-length fill surface of the style, only a part of it is blitted
+        self.fillState = None
+        # The rectangle of the filled part on the screen and the area of the surface that is blitted
+        self.fillRect = self.scaleRect.copy()
+        self.fillArea = Rect((0, 0), self.scaleRect.size)
+        self.updateFillSurface()
+
+    def updateFillSurface(self):
+        # Switch to the disabled fill when the slider has been disabled
+        state = 'normal' if self.onEnabled else 'disabled'
+        if state != self.fillState:
+            self.fillState = state
+            self.isDirty = True
+
+        # The filled part goes from the start of the scale to the side of the slider facing it
+        index = self.axis.index
+        if self.axis.direction > 0:
+            filled = self.sliderRect[index] - self.scaleRect[index]
+        else:
+            filled = self.scaleRect[index] + self.scaleRect.size[index] - self.sliderRect[index] - self.sliderRect.size[index]
+        filled = max(filled, 0)
+
+        size = list(self.scaleRect.size)
+        size[index] = filled
+        self.fillRect.size = self.fillArea.size = size
+        if self.axis.direction > 0:
+            self.fillRect.topleft = self.scaleRect.topleft
+        else:
+            self.fillRect.bottomleft = self.scaleRect.bottomleft
+
+    def changeCurrentValue(self):
+        # Look up the current value for the position of the slider on the scale
+        self.currentValue = self.pixelToValue(self.sliderRect.center[self.axis.index])
+
+        # Resize the filled part of the scale
+        self.updateFillSurface()
+
+        # The slider, the scale and the value label have to be redrawn
+        self.isDirty = True
+
+        # Let the subscribers know, they are notified once per frame
+        notifier.markChanged(self)
+
+    def onChange(self, callback, throttle=0, debounce=0, background=False):
+        return notifier.subscribe(self, callback, throttle, debounce, background)
+
+    def values(self, throttle=0, debounce=0):
+        # Stale values are dropped, a slow consumer only ever gets the latest one
+        return ValueStream(self, throttle, debounce)
+
+    def checkPosition(self, event):
+        index = self.axis.index
+        # Move the slider along the axis and keep its center within the button
+        start = self.buttonRect[index]
+        end = start + self.buttonRect.size[index]
+        center = list(self.sliderRect.center)
+        center[index] = min(max(event.pos[index], start), end)
+        self.sliderRect.center = center
+
+    def handleEvent(self, event):
+        if self.onEnabled:
+            if self.isClicked:
+                if event.type == MOUSEMOTION:
+                    self.checkPosition(event)
+                    self.changeCurrentValue()
+
+            if event.type == MOUSEMOTION:
+                if self.sliderRect.collidepoint(event.pos):
+                    self.isHovered = True
+                    self.setSliderState('hover')
+                else:
+                    self.isHovered = False
+                    self.setSliderState('normal')
+            if event.type == MOUSEBUTTONDOWN and self.isHovered:
+                if event.button == 1:
+                    self.isClicked = True
+            elif event.type == MOUSEBUTTONDOWN and self.scaleRect.collidepoint(event.pos):
+                if event.button == 1:
+                    self.checkPosition(event)
+                    self.changeCurrentValue()
+
+            elif event.type == MOUSEBUTTONUP:
+                self.isClicked = False
+        else:
+            self.setSliderState('disabled')
+
+    def setSliderState(self, state):
+        # The slider is redrawn only when its state actually changes
+        if state != self.sliderState:
+            self.sliderState = state
+            self.isDirty = True
+
+    def setEnabled(self, enabled):
+        self.onEnabled = enabled
+        if not enabled:
+            self.isHovered = self.isClicked = False
+        # Recolor the slider and the filled part of the scale
+        self.setSliderState('normal' if enabled else 'disabled')
+        self.updateFillSurface()
+        self.isDirty = True
+
+    def setValue(self, value, notify=True):
+        value = min(max(value, self.minValue), self.maxValue)
+        center = list(self.sliderRect.center)
+        center[self.axis.index] = self.valueToPixel(value)
+        self.sliderRect.center = center
+        if notify:
+            self.changeCurrentValue()
+        else:
+            self.currentValue = self.pixelToValue(self.sliderRect.center[self.axis.index])
+            self.updateFillSurface()
+            self.isDirty = True
+
+    def setRange(self, minValue, maxValue, notify=True):
+        if (minValue, maxValue) == (self.minValue, self.maxValue):
+            return
+        # The min and max labels change size and the slider moves, the old ones have to be erased
+        self.invalidate()
+        value = self.currentValue
+        self.minValue, self.maxValue = minValue, maxValue
+        # The step, the lookup table and the labels all depend on the range
+        length = self.size[self.axis.index]
+        self.oneStepValue = length / (maxValue - minValue)
+        self.pixelValues = getPixelValues(length, minValue, maxValue)
+        self.createLabels()
+        # Keep the value, the subscribers are only told when it had to be clamped into the new range
+        self.setValue(value, notify=notify and not minValue <= value <= maxValue)
+
+    def moveTo(self, pos):
+        # The old position is erased and nothing has been drawn at the new one yet
+        self.invalidate()
+        dx, dy = pos[0] - self.pos[0], pos[1] - self.pos[1]
+        self.pos = pos
+        for rect in (self.buttonRect, self.scaleRect, self.sliderRect, self.fillRect):
+            rect.move_ip(dx, dy)
+
+    def invalidate(self):
+        # Whatever was drawn has to be restored from the background, the whole slider is drawn again
+        if self.drawnRects is not None:
+            self.staleRects = (*self.staleRects, *self.drawnRects, self.getBounds())
+            self.drawnRects = None
+        self.isDirty = True
+
+    def createLabels(self):
+        # Render the min and max labels once, they never change
+        self.minText = fontCache.render(str(self.minValue), self.textColor, self.style.fontName, self.style.fontSize)
+        self.maxText = fontCache.render(str(self.maxValue), self.textColor, self.style.fontName, self.style.fontSize)
+        # The value label is rendered lazily and only when the displayed value changes
+        self.valueLabel = None
+        self.valueText = None
+
+    def renderValueText(self):
+        label = str(self.currentValue)
+        # Re-render the value label only when the displayed text has changed
+        if label != self.valueLabel:
+            self.valueLabel = label
+            self.valueText = fontCache.getFont(self.style.fontName, self.style.fontSize).render(label, True, self.textColor)
+
+    def getLabelRects(self):
+        self.renderValueText()
+        maxWidth = self.maxText.get_width()
+        # Min and max labels sit beyond the ends of the scale, the value label follows the slider
+        if self.axis.index == 0:
+            return (self.minText.get_rect(topleft=(self.scaleRect.left - maxWidth, self.scaleRect.y)),
+                    self.maxText.get_rect(topleft=(self.scaleRect.right + maxWidth, self.scaleRect.y)),
+                    self.valueText.get_rect(topleft=(self.sliderRect.centerx - self.valueText.get_width() // 2, self.buttonRect.top - self.valueText.get_height())))
+        return (self.minText.get_rect(topleft=(self.scaleRect.x, self.scaleRect.bottom + maxWidth)),
+                self.maxText.get_rect(topleft=(self.scaleRect.x, self.scaleRect.top - maxWidth)),
+                self.valueText.get_rect(topleft=(self.buttonRect.left - self.valueText.get_width(), self.sliderRect.centery - self.valueText.get_height() // 2)))
+
+    def getBounds(self):
+        # The whole area covered by the slider, including its labels
+        return self.buttonRect.unionall([self.scaleRect, self.sliderRect, *self.getLabelRects()])
+
+    def getDirtyRects(self):
+        # Nothing has changed since the last frame
+        if not self.isDirty:
+            return []
+        # The slider has never been drawn, so its whole area is invalid
+        if self.drawnRects is None:
+            return [*self.staleRects, self.getBounds()]
+        # Otherwise only the old and new slider, the scale with its fill and the old and new value label
+        return [*self.drawnRects, self.sliderRect.copy(), self.scaleRect.copy(), self.getLabelRects()[2]]
+
+    def getTarget(self, surface=None):
+        # Draw on the given surface, else on the screen of the slider, else on the window
+        if surface is not None:
+            return surface
+        if self.screen is not None:
+            return self.screen
+        return getScreen()
+
+    def drawText(self, surface=None, offset=(0, 0)):
+        surface = self.getTarget(surface)
+        x, y = offset
+        minRect, maxRect, valueRect = self.getLabelRects()
+
+        surface.blit(self.minText, (minRect.x + x, minRect.y + y))
+        surface.blit(self.maxText, (maxRect.x + x, maxRect.y + y))
+        surface.blit(self.valueText, (valueRect.x + x, valueRect.y + y))
+        return valueRect
+
+    def draw(self, surface=None, offset=(0, 0)):
+        surface = self.getTarget(surface)
+        x, y = offset
+        style = self.style
+        # The shared surfaces of the style, a fully transparent button is skipped
+        buttonSurface = style.getSurface('button')
+        if buttonSurface is not None:
+            surface.blit(buttonSurface, (self.buttonRect.x + x, self.buttonRect.y + y))
+        surface.blit(style.getSurface('fill', self.fillState), (self.fillRect.x + x, self.fillRect.y + y), self.fillArea)
+        surface.blit(style.getSurface('scale'), (self.scaleRect.x + x, self.scaleRect.y + y))
+        surface.blit(style.getSurface('slider', self.sliderState), (self.sliderRect.x + x, self.sliderRect.y + y))
+        valueRect = self.drawText(surface, offset)
+
+        # Remember what was drawn so the next change can invalidate it
+        self.drawnRects = (self.sliderRect.copy(), valueRect)
+        self.staleRects = ()
+        self.isDirty = False
+
+    def update(self, target=None):
+        self.draw(target)
@@ -0,0 +1,194 @@
+from pygame.locals import MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP
+
+from classChangeNotifier import notifier
+
+from dataclasses import dataclass, field
+
+
+def getIndexedValues(values, count):
+    """
+    Returns the indexes and the values of a bulk update as NumPy arrays.
+
+    The values are either one value per item, `count` of them, or a mapping of item
+    indexes to values.
+    """
+    import numpy as np
+    if isinstance(values, dict):
+        indexes = np.fromiter(values.keys(), dtype=np.intp, count=len(values))
+        targets = np.fromiter(values.values(), dtype=np.float64, count=len(values))
+    else:
+        targets = np.asarray(values, dtype=np.float64)
+        if len(targets) != count:
+            raise ValueError(f'Expected {count} values, got {len(targets)}')
+        indexes = np.arange(count)
+    return indexes, targets
+
+
+@dataclass
+class SliderGroup:
+    """
+    A class that owns a collection of sliders and routes pointer events to them.
+
+    The area each slider reacts to is indexed in a uniform grid, so finding the slider
+    under the cursor only looks at the few sliders sharing its cell. Pointer events are
+    passed only to the slider under the cursor, or to the slider holding the capture while
+    it is dragged, and the previously hovered slider gets a motion event only when the
+    cursor leaves it. Handling an event therefore does not depend on the number of sliders.
+
+    Values can be set in bulk with `setValues()`: they are clamped to the ranges and mapped
+    to pixels and back to values for all the sliders at once with NumPy, and only the
+    sliders whose position actually changes are touched and marked dirty.
+
+    Attributes:
+        sliders (list): The sliders of the group, drawn in this order.
+        cellSize (int): The size of a grid cell in pixels.
+        grid (dict): The sliders and their hit rectangles keyed by grid cell.
+        hovered (object): The slider under the cursor.
+        captured (object): The slider being dragged.
+
+    Methods:
+        __post_init__(): Indexes the initial sliders.
+        getHitRect(slider): Returns the area the slider reacts to.
+        getCells(rect): Returns the grid cells covered by the rectangle.
+        add(slider): Adds a slider to the group.
+        remove(slider): Removes a slider from the group.
+        reindex(): Rebuilds the grid, needed after sliders have been moved or re-ranged.
+        getGeometry(): Returns the ranges and scales of the sliders as NumPy arrays.
+        setValues(values, notify): Sets the values of many sliders at once.
+        sliderAt(pos): Returns the topmost slider at the given position.
+        draw(surface, offset): Draws all the sliders on the surface, shifted by the offset.
+        handleEvent(event): Routes a pointer event to the slider it concerns.
+    """
+
+    sliders: list = field(default_factory=list)
+    cellSize: int = 64
+    grid: dict = field(default_factory=dict)
+    hovered: object = None
+    captured: object = None
+
+    def __post_init__(self):
+        self.geometry = None
+        self.reindex()
+
+    def getHitRect(self, slider):
+        # The slider sticks out of the scale by half of its size at both ends
+        return slider.buttonRect.union(slider.scaleRect).inflate(slider.sliderRect.size)
+
+    def getCells(self, rect):
+        cellSize = self.cellSize
+        for cellX in range(rect.left // cellSize, (rect.right - 1) // cellSize + 1):
+            for cellY in range(rect.top // cellSize, (rect.bottom - 1) // cellSize + 1):
+                yield cellX, cellY
+
+    def add(self, slider):
+        self.sliders.append(slider)
+        self.geometry = None
+        hitRect = self.getHitRect(slider)
+        for cell in self.getCells(hitRect):
+            self.grid.setdefault(cell, []).append((slider, hitRect))
+
+    def remove(self, slider):
+        self.sliders.remove(slider)
+        self.geometry = None
+        if self.hovered is slider:
+            self.hovered = None
+        if self.captured is slider:
+            self.captured = None
+        for cell in self.getCells(self.getHitRect(slider)):
+            entries = self.grid[cell]
+            entries[:] = [entry for entry in entries if entry[0] is not slider]
+            if not entries:
+                del self.grid[cell]
+
+    def reindex(self):
+        sliders = list(self.sliders)
+        self.sliders.clear()
+        self.grid.clear()
+        for slider in sliders:
+            self.add(slider)
+
+    def sliderAt(self, pos):
+        entries = self.grid.get((pos[0] // self.cellSize, pos[1] // self.cellSize))
+        if entries:
+            # Sliders added later are drawn on top, so they are checked first
+            for slider, hitRect in reversed(entries):
+                if hitRect.collidepoint(pos):
+                    return slider
+        return None
+
+    def getGeometry(self):
+        # NumPy is only imported once values are set in bulk, it is slow to import at startup
+        import numpy as np
+        if self.geometry is None:
+            sliders = self.sliders
+            self.geometry = {
+                'minValues': np.array([slider.minValue for slider in sliders], dtype=np.float64),
+                'maxValues': np.array([slider.maxValue for slider in sliders], dtype=np.float64),
+                'steps': np.array([slider.oneStepValue for slider in sliders], dtype=np.float64),
+                'starts': np.array([slider.getScaleStart() for slider in sliders], dtype=np.float64),
+                'directions': np.array([slider.axis.direction for slider in sliders], dtype=np.float64),
+            }
+        return self.geometry
+
+    def setValues(self, values, notify=True):
+        import numpy as np
+        geometry = self.getGeometry()
+        # Either one value per slider or a mapping of slider indexes to values
+        indexes, targets = getIndexedValues(values, len(self.sliders))
+
+        minValues, steps = geometry['minValues'][indexes], geometry['steps'][indexes]
+        starts, directions = geometry['starts'][indexes], geometry['directions'][indexes]
+        clamped = np.clip(targets, minValues, geometry['maxValues'][indexes])
+        # The same mapping as valueToPixel and the pixel to value tables, for all the sliders at once
+        pixels = starts + directions * (clamped - minValues) * steps
+        # Rounded the way pygame rounds rect coordinates, halves away from zero
+        pixels = np.copysign(np.floor(np.abs(pixels) + 0.5), pixels)
+        offsets = (pixels - starts) * directions
+        currentValues = minValues + offsets / steps
+
+        sliders = self.sliders
+        for index, pixel, value in zip(indexes.tolist(), pixels.astype(np.intp).tolist(), currentValues.tolist()):
+            slider = sliders[index]
+            axis = slider.axis.index
+            # Sliders already at the position are left alone
+            if slider.sliderRect.center[axis] == pixel:
+                continue
+            center = list(slider.sliderRect.center)
+            center[axis] = pixel
+            slider.sliderRect.center = center
+            slider.currentValue = value
+            slider.updateFillSurface()
+            slider.isDirty = True
+            if notify:
+                notifier.markChanged(slider)
+
+    def draw(self, surface, offset=(0, 0)):
+        # Draw all the sliders, for example to pre-composite them on a cached panel surface
+        for slider in self.sliders:
+            slider.draw(surface, offset)
+
+    def handleEvent(self, event):
+        if event.type == MOUSEMOTION:
+            # The dragged slider gets all the motion until the button is released
+            if self.captured is not None:
+                self.captured.handleEvent(event)
+                return
+            target = self.sliderAt(event.pos)
+            # The cursor has left the previous slider, let it drop its hover state
+            if self.hovered is not None and self.hovered is not target:
+                self.hovered.handleEvent(event)
+            self.hovered = target
+            if target is not None:
+                target.handleEvent(event)
+
+        elif event.type == MOUSEBUTTONDOWN:
+            target = self.sliderAt(event.pos)
+            if target is not None:
+                target.handleEvent(event)
+                if target.isClicked:
+                    self.captured = self.hovered = target
+
+        elif event.type == MOUSEBUTTONUP:
+            if self.captured is not None:
+                self.captured.handleEvent(event)
+                self.captured = None
@@ -0,0 +1,276 @@
+import numpy as np
+import pygame as pg
+from pygame import Rect
+from pygame.locals import MOUSEWHEEL, MOUSEBUTTONDOWN
+
+from classSlider import Slider
+from classSliderStyle import SliderStyle
+from classSliderGroup import SliderGroup, getIndexedValues
+
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class PanelSlider(Slider):
+    """
+    A slider of a `SliderPanel`, showing one channel of the panel at a time.
+
+    Attributes:
+        panel (SliderPanel): The panel the slider belongs to.
+        index (int): The channel the slider shows, None while it is in the pool.
+
+    Methods:
+        changeCurrentValue(): Updates the current value and writes it back to the channel.
+    """
+
+    panel: object = field(default=None, repr=False)
+    index: int = None
+
+    def changeCurrentValue(self):
+        Slider.changeCurrentValue(self)
+        # A value moved by the user is kept by the panel when the slider is recycled
+        if self.index is not None:
+            self.panel.values[self.index] = self.currentValue
+
+
+@dataclass
+class SliderPanel:
+    """
+    A scrollable panel of channels that only builds and draws the sliders in view.
+
+    The state of every channel (value, range and enabled flag) is kept in NumPy arrays,
+    a few bytes per channel. Sliders only exist for the channels intersecting the
+    viewport: when a channel scrolls out of view its slider goes back to a pool and is
+    moved, re-ranged and re-valued for the next channel scrolling in, so the memory and
+    the frame time depend on the size of the viewport and not on the number of channels.
+    The channels are laid out side by side across the orientation of the sliders, so
+    vertical sliders scroll horizontally like the strips of a mixer.
+
+    The panel is a single widget for the compositor, it draws its sliders clipped to the
+    viewport, and a single handler for the loop, it scrolls on the mouse wheel and routes
+    the pointer events to its sliders.
+
+    Attributes:
+        rect (Rect): The viewport of the panel on the screen.
+        count (int): The number of channels.
+        orientation (str): The orientation of the sliders, 'horizontal' or 'vertical'.
+        sliderSize (tuple): The size of a slider.
+        spacing (int): The space between two sliders, it holds the value labels.
+        minValue (int | float): The initial minimum value of the channels.
+        maxValue (int | float): The initial maximum value of the channels.
+        value (int | float): The initial value of the channels.
+        style (SliderStyle): The look of the sliders, the default one if None.
+        wheelStep (int): The number of pixels scrolled by one step of the mouse wheel, one channel if 0.
+        scroll (int): The scroll offset in pixels.
+
+    Methods:
+        __post_init__(): Creates the backing store and the sliders in view.
+        getPitch(): Returns the distance between two channels.
+        getMaxScroll(): Returns the largest scroll offset.
+        getVisibleRange(): Returns the range of the channels in view.
+        getSliderPos(index): Returns the position of the slider of a channel.
+        acquire(): Returns a slider from the pool, creating one if it is empty.
+        bind(index): Shows a channel with a slider.
+        release(index): Puts the slider of a channel back into the pool.
+        layout(): Binds the channels scrolled into view and releases the others.
+        scrollTo(offset): Scrolls to the given offset.
+        scrollBy(pixels): Scrolls by the given number of pixels.
+        getValue(index): Returns the value of a channel.
+        setValue(index, value): Sets the value of a channel.
+        setValues(values): Sets the values of many channels at once.
+        setRange(index, minValue, maxValue): Sets the range of a channel.
+        setEnabled(index, enabled): Enables or disables a channel.
+        handleEvent(event): Scrolls on the mouse wheel and routes the pointer events.
+        getBounds(): Returns the viewport.
+        getDirtyRects(): Returns the areas invalidated since the last frame.
+        update(target): Draws the sliders in view clipped to the viewport.
+    """
+
+    rect: Rect = field(default_factory=lambda: Rect(0, 0, 400, 300))
+    count: int = 0
+    orientation: str = 'vertical'
+    sliderSize: tuple = (50, 200)
+    spacing: int = 40
+    minValue: int | float = 0
+    maxValue: int | float = 100
+    value: int | float = 50
+    style: SliderStyle = None
+    wheelStep: int = 0
+    scroll: int = 0
+
+    def __post_init__(self):
+        self.rect = Rect(self.rect)
+        # The scroll axis runs across the sliders
+        self.scrollIndex = 1 if self.orientation == 'horizontal' else 0
+        if self.style is None:
+            self.style = SliderStyle(size=self.sliderSize, orientation=self.orientation)
+
+        # The backing store, one entry per channel
+        self.values = np.full(self.count, self.value, dtype=np.float64)
+        self.minValues = np.full(self.count, self.minValue, dtype=np.float64)
+        self.maxValues = np.full(self.count, self.maxValue, dtype=np.float64)
+        self.enabled = np.ones(self.count, dtype=bool)
+
+        self.pool = []
+        self.visible = {}
+        self.group = SliderGroup()
+        self.needsRedraw = True
+        self.scroll = min(max(self.scroll, 0), self.getMaxScroll())
+        self.layout()
+
+    @property
+    def isDirty(self):
+        return self.needsRedraw or any(slider.isDirty for slider in self.visible.values())
+
+    def getPitch(self):
+        return self.sliderSize[self.scrollIndex] + self.spacing
+
+    def getMaxScroll(self):
+        return max(self.count * self.getPitch() + self.spacing - self.rect.size[self.scrollIndex], 0)
+
+    def getVisibleRange(self):
+        pitch = self.getPitch()
+        # A channel is in view as soon as any part of its slot is
+        first = self.scroll // pitch
+        last = (self.scroll + self.rect.size[self.scrollIndex] - 1) // pitch
+        return range(max(first, 0), min(last + 1, self.count))
+
+    def getSliderPos(self, index):
+        pos = [0, 0]
+        # The spacing before every slider leaves room for its value label
+        pos[self.scrollIndex] = self.rect[self.scrollIndex] + index * self.getPitch() + self.spacing - self.scroll
+        crossIndex = 1 - self.scrollIndex
+        pos[crossIndex] = self.rect[crossIndex] + (self.rect.size[crossIndex] - self.sliderSize[crossIndex]) // 2
+        return tuple(pos)
+
+    def acquire(self):
+        if self.pool:
+            return self.pool.pop()
+        return PanelSlider(pos=self.rect.topleft, size=self.sliderSize, orientation=self.orientation,
+                           style=self.style, minValue=self.minValue, maxValue=self.maxValue,
+                           currentValue=self.value, panel=self)
+
+    def bind(self, index):
+        slider = self.acquire()
+        slider.moveTo(self.getSliderPos(index))
+        slider.setRange(self.minValues[index].item(), self.maxValues[index].item(), notify=False)
+        slider.isHovered = slider.isClicked = False
+        slider.setEnabled(bool(self.enabled[index]))
+        # The slider shows the stored value, its own rounding to the pixel is not written back
+        slider.setValue(self.values[index].item(), notify=False)
+        slider.index = index
+        self.visible[index] = slider
+        self.group.add(slider)
+
+    def release(self, index):
+        slider = self.visible.pop(index)
+        self.group.remove(slider)
+        slider.index = None
+        slider.isHovered = slider.isClicked = False
+        self.pool.append(slider)
+
+    def layout(self):
+        visibleRange = self.getVisibleRange()
+        for index in [index for index in self.visible if index not in visibleRange]:
+            self.release(index)
+        # The sliders still in view only move along the scroll axis
+        for index, slider in self.visible.items():
+            pos = self.getSliderPos(index)
+            if pos != slider.pos:
+                self.group.remove(slider)
+                slider.moveTo(pos)
+                self.group.add(slider)
+        for index in visibleRange:
+            if index not in self.visible:
+                self.bind(index)
+
+    def scrollTo(self, offset):
+        offset = min(max(int(offset), 0), self.getMaxScroll())
+        if offset != self.scroll:
+            self.scroll = offset
+            self.layout()
+            self.needsRedraw = True
+
+    def scrollBy(self, pixels):
+        self.scrollTo(self.scroll + pixels)
+
+    def getValue(self, index):
+        return self.values[index].item()
+
+    def setValue(self, index, value):
+        # The backing store only holds values inside the range of the channel
+        self.values[index] = min(max(value, self.minValues[index].item()), self.maxValues[index].item())
+        slider = self.visible.get(index)
+        if slider is not None:
+            slider.setValue(self.values[index].item(), notify=False)
+
+    def setValues(self, values):
+        # Either one value per channel or a mapping of channel indexes to values
+        indexes, targets = getIndexedValues(values, self.count)
+        self.values[indexes] = np.clip(targets, self.minValues[indexes], self.maxValues[indexes])
+
+        # Only the channels in view have sliders to move
+        positions = {id(slider): position for position, slider in enumerate(self.group.sliders)}
+        self.group.setValues({positions[id(slider)]: self.values[index].item() for index, slider in self.visible.items()},
+                             notify=False)
+
+    def setRange(self, index, minValue, maxValue):
+        self.minValues[index], self.maxValues[index] = minValue, maxValue
+        self.values[index] = min(max(self.values[index].item(), minValue), maxValue)
+        slider = self.visible.get(index)
+        if slider is not None:
+            slider.setRange(minValue, maxValue, notify=False)
+            slider.setValue(self.values[index].item(), notify=False)
+            # The bulk mapping of the group depends on the ranges
+            self.group.reindex()
+
+    def setEnabled(self, index, enabled):
+        self.enabled[index] = enabled
+        slider = self.visible.get(index)
+        if slider is not None:
+            slider.setEnabled(enabled)
+
+    def handleEvent(self, event):
+        if event.type == MOUSEWHEEL:
+            if self.rect.collidepoint(pg.mouse.get_pos()):
+                step = self.wheelStep or self.getPitch()
+                # Wheel up scrolls back, a horizontal wheel scrolls along as well
+                self.scrollBy((event.x - event.y) * step)
+            return
+        # Sliders partly scrolled out of view cannot be grabbed outside the viewport
+        if event.type == MOUSEBUTTONDOWN and not self.rect.collidepoint(event.pos):
+            return
+        self.group.handleEvent(event)
+
+    def getBounds(self):
+        return self.rect
+
+    def getDirtyRects(self):
+        # A scrolled panel has moved all of its contents
+        if self.needsRedraw:
+            return [self.rect.copy()]
+        rects = []
+        for slider in self.visible.values():
+            if not slider.isDirty:
+                continue
+            sliderRects = [rect for rect in (rect.clip(self.rect) for rect in slider.getDirtyRects()) if rect]
+            # Changes that are all outside the viewport are never drawn
+            if not sliderRects:
+                slider.isDirty = False
+            rects.extend(sliderRects)
+        return rects
+
+    def update(self, target=None):
+        if target is None:
+            from classScreen import getScreen
+            target = getScreen()
+        # Draw inside the viewport and inside the area being redrawn
+        clip = target.get_clip()
+        area = clip.clip(self.rect)
+        if area:
+            target.set_clip(area)
+            for slider in self.visible.values():
+                if slider.getBounds().colliderect(area):
+                    slider.draw(target)
+            target.set_clip(clip)
+        self.needsRedraw = False
@@ -0,0 +1,138 @@
+import pygame as pg
+from pygame import Surface
+
+from dataclasses import dataclass
+
+# The surfaces of all styles keyed by (style, layer, state), shared by every slider of a style
+styleSurfaces = {}
+# The keys of the surfaces created before the display existed, they are converted once it does
+unconvertedKeys = set()
+
+# The fields that may be given as lists, for example when read from JSON
+SEQUENCE_FIELDS = ('size', 'colorButton', 'colorScaleLeft', 'hoverColorSlider', 'colorSlider',
+                   'hoverColor', 'textColor', 'disabledColor')
+
+
+@dataclass(frozen=True)
+class SliderStyle:
+    """
+    A class describing the look of a slider and owning the surfaces it is drawn with.
+
+    A style is an immutable, hashable value shared by any number of sliders. Its surfaces
+    are created once per style, layer and state, converted to the display format so each
+    blit is a plain same-format copy, and cached for every slider using an equal style.
+    Layers that are fully transparent are never created or blitted.
+
+    Layers and their states:
+        'scale': 'normal', the translucent scale.
+        'fill': 'normal' or 'disabled', the full-length filled part of the scale.
+        'slider': 'normal', 'hover' or 'disabled', the draggable slider.
+
+    Attributes:
+        size (tuple): The size of the button.
+        orientation (str): The orientation of the slider, 'horizontal' or 'vertical'.
+        colorButton (str | tuple): The color of the button and of the scale.
+        buttonAlpha (int): The alpha of the button, 0 to leave it out.
+        scaleAlpha (int): The alpha of the scale.
+        colorScaleLeft (str | tuple): The color of the filled part of the scale.
+        hoverColorSlider (str | tuple): The color of the slider when hovered.
+        colorSlider (str | tuple): The color of the slider.
+        hoverColor (str | tuple): The color when the slider is hovered.
+        textColor (str | tuple): The color of the text.
+        disabledColor (str | tuple): The color when the slider is disabled.
+        fontName (str): The name of the label font.
+        fontSize (int): The size of the label font.
+
+    Methods:
+        __post_init__(): Turns the size and the colors into tuples so the style stays hashable.
+        getIndex(): Returns the index of the axis of the orientation.
+        getScaleSize(): Returns the size of the scale.
+        getSliderSize(): Returns the size of the slider.
+        getColor(layer, state): Returns the color of a layer in a state.
+        getSurface(layer, state): Returns the shared surface of a layer in a state.
+        createSurface(layer, state): Creates the surface of a layer in a state.
+    """
+
+    size: tuple = (200, 50)
+    orientation: str = 'horizontal'
+    colorButton: str | tuple = 'LightGray'
+    buttonAlpha: int = 0
+    scaleAlpha: int = 70
+    colorScaleLeft: str | tuple = 'green'
+    hoverColorSlider: str | tuple = 'red'
+    colorSlider: str | tuple = 'Maroon'
+    hoverColor: str | tuple = 'darkgray'
+    textColor: str | tuple = 'white'
+    disabledColor: str | tuple = 'darkgray'
+    fontName: str = 'arial'
+    fontSize: int = 14
+
+    def __post_init__(self):
+        for name in SEQUENCE_FIELDS:
+            value = getattr(self, name)
+            if not isinstance(value, (str, tuple)):
+                object.__setattr__(self, name, tuple(value))
+
+    def getIndex(self):
+        return 0 if self.orientation == 'horizontal' else 1
+
+    def getScaleSize(self):
+        # The scale runs along the whole button and is a tenth of it thick
+        index = self.getIndex()
+        size = [0, 0]
+        size[index], size[1 - index] = self.size[index], self.size[1 - index] // 10
+        return tuple(size)
+
+    def getSliderSize(self):
+        # The slider is a twentieth of the button long and half of it thick
+        index = self.getIndex()
+        size = [0, 0]
+        size[index], size[1 - index] = self.size[index] // 20, self.size[1 - index] // 2
+        return tuple(size)
+
+    def getColor(self, layer, state):
+        if state == 'disabled':
+            return self.disabledColor
+        if layer == 'slider':
+            return self.hoverColorSlider if state == 'hover' else self.colorSlider
+        if layer == 'fill':
+            return self.colorScaleLeft
+        return self.colorButton
+
+    def getSurface(self, layer, state='normal'):
+        key = (self, layer, state)
+        surface = styleSurfaces.get(key)
+        if surface is None:
+            if key not in styleSurfaces:
+                surface = styleSurfaces[key] = self.createSurface(layer, state)
+        elif unconvertedKeys and key in unconvertedKeys and pg.display.get_surface() is not None:
+            # The display exists now, convert the surface to its format
+            surface = styleSurfaces[key] = self.createSurface(layer, state)
+        return surface
+
+    def createSurface(self, layer, state):
+        key = (self, layer, state)
+        if layer == 'button':
+            # A fully transparent layer would be blitted for nothing
+            if not self.buttonAlpha:
+                return None
+            size, alpha = self.size, self.buttonAlpha
+        elif layer == 'scale':
+            size, alpha = self.getScaleSize(), self.scaleAlpha
+        elif layer == 'fill':
+            size, alpha = self.getScaleSize(), None
+        else:
+            size, alpha = self.getSliderSize(), None
+
+        # Translucent layers keep an alpha channel, the others are opaque
+        surface = Surface(size) if alpha is None else Surface(size, pg.SRCALPHA)
+        surface.fill(self.getColor(layer, state))
+        # Surfaces can only be converted once the display exists
+        if pg.display.get_surface() is not None:
+            surface = surface.convert() if alpha is None else surface.convert_alpha()
+            unconvertedKeys.discard(key)
+        else:
+            unconvertedKeys.add(key)
+        if alpha is not None:
+            surface.set_alpha(alpha)
+        return surface
@@ -0,0 +1,141 @@
+from pygame.locals import MOUSEMOTION, MOUSEBUTTONDOWN
+from pygame import Rect
+
+from classScreen import getScreen
+from classAssets import assets
+from classChangeNotifier import notifier
+
+from dataclasses import dataclass, field
+
+# The areas of the states on images/switch.jpg, a sheet of 3 by 2 switches on a white background.
+# A disabled switch is drawn as a dimmed on or off switch, so it still shows its state
+SWITCH_FRAMES = {
+    'on': Rect(52, 208, 556, 292),
+    'hoverOn': Rect(682, 208, 556, 292),
+    'off': Rect(52, 651, 556, 292),
+    'hoverOff': Rect(682, 651, 556, 292),
+}
+
+
+@dataclass
+class ToggleSwitch:
+    """
+    A class representing an on/off switch drawn from a sprite sheet.
+
+    The sprites of the states are cut out of the sheet, scaled to the size of the switch
+    and cached by the asset manager, so the switch never decodes or scales an image while
+    drawing. Like the sliders the switch handles the pointer events it gets, redraws only
+    when its look changed and reports its changes to the notifier once per frame, with
+    `currentValue` being whether it is on.
+
+    Attributes:
+        screen (object): The surface the switch is drawn on, the window if None.
+        pos (tuple): The position of the switch on the screen.
+        size (tuple): The size of the switch.
+        isOn (bool): Whether the switch is on.
+        isHovered (bool): Whether the switch is currently hovered.
+        onEnabled (bool): Whether the switch is enabled.
+        image (str): The name of the sprite sheet in the images directory.
+        frames (dict): The areas of the states on the sheet.
+        background (tuple): The color of the sheet around the sprites, made transparent.
+        disabledAlpha (int): The opacity of the sprite of a disabled switch.
+        isDirty (bool): Whether the switch has to be redrawn.
+
+    Methods:
+        __post_init__(): Creates the rectangle of the switch and loads its sprites.
+        getState(): Returns the state the switch is drawn in.
+        getSprite(): Returns the sprite of the current state, dimmed if the switch is disabled.
+        handleEvent(event): Handles mouse events to hover and toggle the switch.
+        toggle(): Switches the switch on or off.
+        setOn(isOn): Switches the switch on or off, notifying the subscribers of a change.
+        setEnabled(enabled): Enables or disables the switch.
+        onChange(callback, throttle, debounce, background): Subscribes a callback to the changes.
+        getBounds(): Returns the area covered by the switch.
+        getDirtyRects(): Returns the areas invalidated since the last frame.
+        getTarget(surface): Returns the surface to draw on.
+        draw(surface, offset): Draws the switch on the surface, shifted by the offset.
+        update(target): Draws the switch on the target, its screen or the window.
+    """
+
+    screen: object = None
+    pos: tuple = (0, 0)
+    size: tuple = (96, 50)
+    isOn: bool = False
+    isHovered: bool = False
+    onEnabled: bool = True
+    image: str = 'switch.jpg'
+    frames: dict = field(default_factory=lambda: dict(SWITCH_FRAMES))
+    background: tuple = (255, 255, 255)
+    disabledAlpha: int = 110
+    isDirty: bool = True
+
+    def __post_init__(self):
+        self.rect = Rect(self.pos, self.size)
+        # Decode, cut out and scale all the states up front, toggling never waits for it
+        assets.getSprites(self.image, self.frames, self.size, self.background)
+        assets.getSprites(self.image, {state: self.frames[state] for state in ('on', 'off')},
+                          self.size, self.background, self.disabledAlpha)
+
+    @property
+    def currentValue(self):
+        return self.isOn
+
+    def getState(self):
+        if self.isHovered and self.onEnabled:
+            return 'hoverOn' if self.isOn else 'hoverOff'
+        return 'on' if self.isOn else 'off'
+
+    def getSprite(self):
+        alpha = None if self.onEnabled else self.disabledAlpha
+        return assets.getSprite(self.image, self.frames[self.getState()], self.size, self.background, alpha)
+
+    def handleEvent(self, event):
+        if not self.onEnabled:
+            return
+        if event.type == MOUSEMOTION:
+            isHovered = self.rect.collidepoint(event.pos)
+            if isHovered != self.isHovered:
+                self.isHovered = isHovered
+                self.isDirty = True
+        elif event.type == MOUSEBUTTONDOWN and event.button == 1 and self.rect.collidepoint(event.pos):
+            self.toggle()
+
+    def toggle(self):
+        self.setOn(not self.isOn)
+
+    def setOn(self, isOn):
+        if isOn != self.isOn:
+            self.isOn = isOn
+            self.isDirty = True
+            notifier.markChanged(self)
+
+    def setEnabled(self, enabled):
+        self.onEnabled = enabled
+        if not enabled:
+            self.isHovered = False
+        self.isDirty = True
+
+    def onChange(self, callback, throttle=0, debounce=0, background=False):
+        return notifier.subscribe(self, callback, throttle, debounce, background)
+
+    def getBounds(self):
+        return self.rect
+
+    def getDirtyRects(self):
+        return [self.rect.copy()] if self.isDirty else []
+
+    def getTarget(self, surface=None):
+        # Draw on the given surface, else on the screen of the switch, else on the window
+        if surface is not None:
+            return surface
+        if self.screen is not None:
+            return self.screen
+        return getScreen()
+
+    def draw(self, surface=None, offset=(0, 0)):
+        surface = self.getTarget(surface)
+        surface.blit(self.getSprite(), (self.rect.x + offset[0], self.rect.y + offset[1]))
+        self.isDirty = False
+
+    def update(self, target=None):
+        self.draw(target)
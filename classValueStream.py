@@ -0,0 +1,88 @@
+from classChangeNotifier import notifier
+
+from dataclasses import dataclass
+
+
+@dataclass(eq=False)
+class ValueStream:
+    """
+    A class streaming the values of a slider to an asyncio consumer.
+
+    The stream is an async iterator yielding the current value of the slider first and
+    then every value delivered by the notifier. It holds a single value: a new value
+    overwrites the one the consumer has not taken yet, so a slow consumer always gets
+    the latest value and never a backlog of stale ones, and it never slows down the UI
+    loop. The values are handed over with `call_soon_threadsafe`, so the UI loop may run
+    in the asyncio loop itself or in another thread. Leaving an `async with` block
+    closes the stream.
+
+    Attributes:
+        slider (object): The slider whose values are streamed.
+        throttle (float): The minimum time in seconds between two values.
+        debounce (float): The time in seconds the value has to stay unchanged before it is streamed.
+        subscription (Subscription): The subscription delivering the values, None until the stream is iterated.
+        loop (object): The asyncio loop of the consumer.
+        ready (object): The asyncio event set when a value is waiting.
+        value (int | float): The latest value not taken yet.
+        closed (bool): Whether the stream is closed.
+
+    Methods:
+        open(): Subscribes to the slider in the running asyncio loop.
+        receive(slider, value): Hands a value over to the asyncio loop, called by the notifier.
+        push(value): Stores a value in the asyncio loop, overwriting the one not taken yet.
+        aclose(): Unsubscribes and ends the iteration.
+    """
+
+    slider: object = None
+    throttle: float = 0
+    debounce: float = 0
+    subscription: object = None
+    loop: object = None
+    ready: object = None
+    value: int | float = None
+    closed: bool = False
+
+    def open(self):
+        import asyncio
+        self.loop = asyncio.get_running_loop()
+        self.ready = asyncio.Event()
+        self.push(self.slider.currentValue)
+        self.subscription = notifier.subscribe(self.slider, self.receive, self.throttle, self.debounce)
+
+    def receive(self, slider, value):
+        try:
+            self.loop.call_soon_threadsafe(self.push, value)
+        except RuntimeError:
+            # The consumer loop is gone, nobody will read the stream anymore
+            self.subscription.cancel()
+
+    def push(self, value):
+        self.value = value
+        self.ready.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.subscription is None and not self.closed:
+            self.open()
+        while not self.closed:
+            if self.ready.is_set():
+                self.ready.clear()
+                return self.value
+            await self.ready.wait()
+        raise StopAsyncIteration
+
+    async def aclose(self):
+        self.closed = True
+        if self.subscription is not None:
+            self.subscription.cancel()
+        # Wake up a consumer waiting for the next value
+        if self.ready is not None:
+            self.ready.set()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
@@ -1,88 +1,190 @@
-import pygame as pg
-from pygame import Surface
-from pygame.locals import *
-from pygame.transform import scale
-
-from loguru import logger
-from sys import stdout
-
-from icecream import ic
-from dataclasses import dataclass, field, InitVar
-
-logger.add(stdout,
-           format="{time:DD.MM.YYYY HH:mm:ss} | {level} | {file}:{line} |{message}",
-           level="DEBUG")
-
-from classScreen import screen
-from classHorizontalSliderButton import HorizontalSliderButton
-from classVerticalSliderButton import VerticalSliderButton
-
-pg.init()
-
-
-
-
-hSliderEn = HorizontalSliderButton(screen = screen,
-                                 pos = (50, 50),
-                                 size = (200, 50),
-                                 minValue = 0,
-                                 maxValue = 100,
-                                 currentValue = 50,
-                                 onEnabled = True,)
-
-hSliderDis = HorizontalSliderButton(screen = screen,
-                                 pos = (350, 50),
-                                 size = (200, 50),
-                                 minValue = 0,
-                                 maxValue = 100,
-                                 currentValue = 50,
-                                 onEnabled = False,)
-
-vSliderEn = VerticalSliderButton(screen = screen,
-                               pos = (50, 200),
-                               size = (50, 200),
-                               minValue = 0,
-                               maxValue = 100,
-                               currentValue = 50,
-                               onEnabled = True,)
-
-vSliderDis = VerticalSliderButton(screen = screen,
-                               pos = (300, 200),
-                               size = (50, 200),
-                               minValue = 0,
-                               maxValue = 100,
-                               currentValue = 50,
-                               onEnabled = False,)
-
-
-
-def runGame():
-    run  = True
-    while run:
-        screen.fill('steelblue')
-        for event in pg.event.get():
-            if event.type == pg.QUIT:
-                run = False
-
-            hSliderEn.handleEvent(event)
-            hSliderDis.handleEvent(event)
-            vSliderEn.handleEvent(event)
-            vSliderDis.handleEvent(event)
-
-        hSliderEn.update()
-        hSliderDis.update()
-        vSliderEn.update()
-        vSliderDis.update()
-
-        pg.display.update()
+from time import perf_counter
+
+# Taken before anything heavy is imported, the startup profile is measured from here
+startTime = perf_counter()
+
+from dataclasses import dataclass, field
+from importlib import import_module
+from sys import argv, stderr, stdout
+
+
+@dataclass
+class StartupProfile:
+    """
+    A class measuring where the time to the first frame goes.
+
+    Heavy modules are imported through `importModule()` when they are first needed,
+    so each import shows up as its own phase next to the display creation, the widget
+    construction and the first frame.
+
+    Attributes:
+        start (float): The time the startup began.
+        last (float): The time of the latest mark.
+        phases (list): The names and durations in seconds of the phases so far.
+
+    Methods:
+        mark(name): Ends the current phase under the given name.
+        importModule(name): Imports a module and records the time it took.
+        report(logger): Logs the phases and the total startup time.
+    """
+
+    start: float = 0
+    last: float = 0
+    phases: list = field(default_factory=list)
+
+    def __post_init__(self):
+        self.last = self.start
+
+    def mark(self, name):
+        now = perf_counter()
+        self.phases.append((name, now - self.last))
+        self.last = now
+
+    def importModule(self, name):
+        # Time spent since the last mark is not part of the import
+        self.mark('other')
+        module = import_module(name)
+        self.mark(f'import {name}')
+        return module
+
+    def report(self, logger):
+        for name, duration in self.phases:
+            if name != 'other' or duration >= 0.001:
+                logger.info(f'{name:<40}{duration * 1000:>10.2f} ms')
+        logger.info(f'{"time to first frame":<40}{(self.last - self.start) * 1000:>10.2f} ms')
+
+
+def configureLogging(profile):
+    logger = profile.importModule('loguru').logger
+    # The sinks write from a background thread, a slow consumer of the output never stalls the UI loop
+    logger.remove()
+    logger.add(stderr, enqueue=True)
+    logger.add(stdout,
+               format="{time:DD.MM.YYYY HH:mm:ss} | {level} | {file}:{line} |{message}",
+               level="DEBUG",
+               enqueue=True)
+    return logger
+
+
+def buildSliders(profile, screen):
+    HorizontalSliderButton = profile.importModule('classHorizontalSliderButton').HorizontalSliderButton
+    VerticalSliderButton = profile.importModule('classVerticalSliderButton').VerticalSliderButton
+
+    hSliderEn = HorizontalSliderButton(screen = screen,
+                                     pos = (50, 50),
+                                     size = (200, 50),
+                                     minValue = 0,
+                                     maxValue = 100,
+                                     currentValue = 50,
+                                     onEnabled = True,)
+
+    hSliderDis = HorizontalSliderButton(screen = screen,
+                                     pos = (350, 50),
+                                     size = (200, 50),
+                                     minValue = 0,
+                                     maxValue = 100,
+                                     currentValue = 50,
+                                     onEnabled = False,)
+
+    vSliderEn = VerticalSliderButton(screen = screen,
+                                   pos = (50, 200),
+                                   size = (50, 200),
+                                   minValue = 0,
+                                   maxValue = 100,
+                                   currentValue = 50,
+                                   onEnabled = True,)
+
+    vSliderDis = VerticalSliderButton(screen = screen,
+                                   pos = (300, 200),
+                                   size = (50, 200),
+                                   minValue = 0,
+                                   maxValue = 100,
+                                   currentValue = 50,
+                                   onEnabled = False,)
+
+    return [hSliderEn, hSliderDis, vSliderEn, vSliderDis]
+
+
+def runGame(profile, logger, profileStartup=False, runAsync=False, sharedValues=False, mixer=False):
+    pg = profile.importModule('pygame')
+    # Only the modules the panel uses are initialized, pg.init() would also start audio and joysticks
+    pg.display.init()
+    pg.font.init()
+    profile.mark('pygame init')
+
+    screen = profile.importModule('classScreen').getScreen()
+    profile.mark('display creation')
+
+    # Slider value changes are logged once per frame
+    profile.importModule('classChangeNotifier').notifier.logLevel = 'DEBUG'
+
+    sliders = profile.importModule('classSliderGroup').SliderGroup(sliders = buildSliders(profile, screen))
+    profile.mark('widget construction')
+
+    publisher = None
+    if sharedValues:
+        # Other processes read the values from the 'sliders' shared memory block
+        publisher = profile.importModule('classSharedValues').SharedValuesPublisher(
+            sliders = sliders.sliders,
+            names = ['hSliderEn', 'hSliderDis', 'vSliderEn', 'vSliderDis'])
+
+    ToggleSwitch = profile.importModule('classToggleSwitch').ToggleSwitch
+    switches = [ToggleSwitch(screen = screen, pos = (450, 220), size = (96, 50), isOn = True, onEnabled = True),
+                ToggleSwitch(screen = screen, pos = (450, 300), size = (96, 50), isOn = False, onEnabled = False)]
+    profile.mark('switch construction')
+
+    widgets, handlers = [*sliders.sliders, *switches], [sliders, *switches]
+    if mixer:
+        # A thousand channels, only the strips in view have sliders
+        panel = profile.importModule('classSliderPanel').SliderPanel(rect = pg.Rect(20, 440, 760, 150),
+                                                                      count = 1000,
+                                                                      sliderSize = (40, 110))
+        widgets.append(panel)
+        handlers.append(panel)
+
+    # F3 shows the FPS and the slowest sliders, the instrumentation only runs while it is shown
+    overlay = profile.importModule('classPerfOverlay').PerfOverlay()
+
+    compositor = profile.importModule('classCompositor').Compositor(screen = screen,
+                                                                    background = 'steelblue',
+                                                                    widgets = [*widgets, overlay])
+    driver = profile.importModule('classLoopDriver').LoopDriver(compositor = compositor,
+                                                                handlers = [*handlers, overlay],
+                                                                fps = 60,
+                                                                onDemand = True,
+                                                                waitTimeout = 500,
+                                                                statsInterval = 5)
+    overlay.stats = driver.stats
+    driver.inputStage.allow(pg.KEYDOWN, pg.MOUSEWHEEL)
+
+    driver.start()
+    driver.runFrame()
+    profile.mark('first frame')
+    if profileStartup:
+        profile.report(logger)
+
+    if runAsync:
+        # The frames yield to asyncio, async consumers of the slider values run in between
+        profile.importModule('asyncio').run(driver.runAsync())
+    else:
+        while driver.running:
+            driver.runFrame()
+    if publisher is not None:
+        publisher.close()
     pg.quit()
 
 
-@logger.catch
 def main():
-    runGame()
+    profile = StartupProfile(start = startTime)
+    logger = configureLogging(profile)
+    with logger.catch():
+        runGame(profile, logger,
+                profileStartup = '--profile-startup' in argv[1:],
+                runAsync = '--async' in argv[1:],
+                sharedValues = '--shared-values' in argv[1:],
+                mixer = '--mixer' in argv[1:])
 
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,26 @@
+from types import SimpleNamespace
+
+from classChangeNotifier import ChangeNotifier
+
+
+def test_one_shot_callback_does_not_drop_other_subscriptions():
+    notifier = ChangeNotifier(logLevel=None)
+    sliderA = SimpleNamespace(pos=(0, 0), currentValue=1)
+    sliderB = SimpleNamespace(pos=(0, 50), currentValue=2)
+    received = []
+
+    # A one-shot callback cancels its own subscription while the values are delivered
+    subscriptionA = notifier.subscribe(sliderA, lambda slider, value: subscriptionA.cancel())
+    notifier.subscribe(sliderB, lambda slider, value: received.append(value))
+
+    notifier.markChanged(sliderA)
+    notifier.markChanged(sliderB)
+    notifier.flush()
+    assert received == [2]
+    assert notifier.waiting == []
+
+    sliderB.currentValue = 3
+    notifier.markChanged(sliderB)
+    notifier.flush()
+    assert received == [2, 3]
+    assert id(sliderA) not in notifier.subscriptions
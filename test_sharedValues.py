@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+from multiprocessing import get_all_start_methods, get_context
+from pathlib import Path
+from types import SimpleNamespace
+
+from classSharedValues import SharedValuesPublisher, SharedValuesReader
+
+
+def readValue(name, index):
+    reader = SharedValuesReader(name)
+    try:
+        return reader.get(index)
+    finally:
+        reader.close()
+
+
+def publishToWorkers(name):
+    publisher = SharedValuesPublisher([SimpleNamespace(currentValue=42.5)], name=name)
+    try:
+        values = []
+        # The workers share the resource tracker of this process
+        for method in ('spawn', 'fork'):
+            if method in get_all_start_methods():
+                with get_context(method).Pool(1) as pool:
+                    values.append(pool.apply(readValue, (name, 0)))
+        return values
+    finally:
+        publisher.close()
+
+
+def test_reader_in_worker_keeps_the_block_tracked():
+    # A fresh interpreter, the resource tracker reports a lost registration on its stderr when the block is removed
+    script = f'import test_sharedValues; print(*test_sharedValues.publishToWorkers("sliders_test_{os.getpid()}"))'
+    result = subprocess.run([sys.executable, '-c', script], cwd=Path(__file__).parent,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    values = [float(value) for value in result.stdout.split()]
+    assert values and all(value == 42.5 for value in values)
+    assert 'KeyError' not in result.stderr, result.stderr